@@ -0,0 +1,94 @@
+from typing import Callable, Dict, List, Tuple
+
+
+# Famílias de gramáticas sintéticas parametrizadas pelo tamanho.
+# Cada função devolve (gramática, sentença aceita pela gramática convertida).
+Family = Callable[[int], Tuple[str, List[str]]]
+
+
+def left_recursive_chain(size: int) -> Tuple[str, List[str]]:
+    # A_i -> A_i c_i | b_i A_(i-1)   (recursão imediata; A_(i-1) fora do início)
+    # A_i -> A_(i-1) a_i             (só para i par: recursão indireta de tamanho constante)
+    # O símbolo inicial é o último da cadeia, de onde todos os outros são alcançáveis.
+    lines: List[str] = list()
+    for i in reversed(range(size)):
+        non_terminal: str = f"A{i:05d}"
+        previous: str = f"A{i - 1:05d}" if i > 0 else ""
+        lines.append(f"{non_terminal} -> b{i} {previous}")
+        lines.append(f"{non_terminal} -> {non_terminal} c{i}")
+        if i % 2 == 0 and i > 0:
+            lines.append(f"{non_terminal} -> {previous} a{i}")
+
+    sentence: List[str] = [f"b{i}" for i in reversed(range(size))]
+    return "\n".join(lines), sentence
+
+
+def keyword_alternatives(size: int) -> Tuple[str, List[str]]:
+    # P -> K P | &,  K -> kw_i id ;   (linhas largas na tabela)
+    lines: List[str] = ["P -> K P", "P -> &"]
+    lines += [f"K -> kw{i} id ;" for i in range(size)]
+    sentence: List[str] = list()
+    for i in range(size):
+        sentence += [f"kw{i}", "id", ";"]
+
+    return "\n".join(lines), sentence
+
+
+def common_prefixes(size: int) -> Tuple[str, List[str]]:
+    # P -> C P | &,  C -> p_0 ... p_(size-1) x_i   (todas as alternativas compartilham o prefixo)
+    prefix: List[str] = [f"p{i}" for i in range(size)]
+    lines: List[str] = ["P -> C P", "P -> &"]
+    lines += [f"C -> {' '.join(prefix)} x{i}" for i in range(size)]
+    sentence: List[str] = list()
+    for i in range(size):
+        sentence += prefix + [f"x{i}"]
+
+    return "\n".join(lines), sentence
+
+
+def leading_non_terminals(size: int) -> Tuple[str, List[str]]:
+    # A -> B A | &,  B -> X_i x_i,  X_i -> a_i   (todas as alternativas de B começam com não terminal)
+    lines: List[str] = ["A -> B A", "A -> &"]
+    lines += [f"B -> X{i:05d} x{i}" for i in range(size)]
+    lines += [f"X{i:05d} -> a{i}" for i in range(size)]
+    sentence: List[str] = list()
+    for i in range(size):
+        sentence += [f"a{i}", f"x{i}"]
+
+    return "\n".join(lines), sentence
+
+
+def wide_alternation(size: int) -> Tuple[str, List[str]]:
+    # Z -> S Z | &,  S -> A_i x_i,  A_i -> a_i   (A_i < S: a eliminação de recursão substitui
+    # todos os A_i nas produções de S, que tem `size` alternativas)
+    lines: List[str] = ["Z -> S Z", "Z -> &"]
+    lines += [f"S -> A{i:05d} x{i}" for i in range(size)]
+    lines += [f"A{i:05d} -> a{i}" for i in range(size)]
+    sentence: List[str] = list()
+    for i in range(size):
+        sentence += [f"a{i}", f"x{i}"]
+
+    return "\n".join(lines), sentence
+
+
+def nullable_cascade(size: int) -> Tuple[str, List[str]]:
+    # N_i -> M_i N_(i+1),  M_i -> a_i | &,  N_size -> end
+    # Cada M_i anulável faz o FOLLOW depender de todos os FIRST seguintes.
+    lines: List[str] = list()
+    for i in range(size):
+        lines.append(f"N{i:05d} -> M{i:05d} N{i + 1:05d}")
+        lines.append(f"M{i:05d} -> a{i}")
+        lines.append(f"M{i:05d} -> &")
+    lines.append(f"N{size:05d} -> end")
+    sentence: List[str] = [f"a{i}" for i in range(0, size, 2)] + ["end"]
+    return "\n".join(lines), sentence
+
+
+FAMILIES: Dict[str, Family] = {
+    "left_recursive_chain": left_recursive_chain,
+    "keyword_alternatives": keyword_alternatives,
+    "common_prefixes": common_prefixes,
+    "leading_non_terminals": leading_non_terminals,
+    "wide_alternation": wide_alternation,
+    "nullable_cascade": nullable_cascade,
+}
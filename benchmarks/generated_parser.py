@@ -0,0 +1,60 @@
+import importlib.util
+import os
+import sys
+import tempfile
+from time import perf_counter
+from typing import Callable, List
+
+from utils.model.Grammar import NonContextGrammar
+from utils.model.ParserGenerator import write_parser_module
+from utils.model.PushdownAutomata import PushDownAutomata
+
+
+GRAMMAR: str = "E -> E + T\n" \
+               "E -> T\n" \
+               "T -> T * F\n" \
+               "T -> F\n" \
+               "F -> ( E )\n" \
+               "F -> id"
+
+
+def expression(size: int) -> List[str]:
+    return ("id + ( id * id ) * " * size + "id").split()
+
+
+def best_of(function: Callable[[], bool], repeat: int = 3) -> float:
+    timings: List[float] = list()
+    for _ in range(repeat):
+        start: float = perf_counter()
+        assert function()
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+def main(sizes: List[int]) -> None:
+    grammar = NonContextGrammar(GRAMMAR)
+    grammar.convert_grammar()
+    table = grammar.construct_analysis_table()
+    automata = PushDownAutomata(grammar.get_initial_state(), table)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "expression_parser.py")
+        write_parser_module(path, grammar.get_initial_state(), table)
+        spec = importlib.util.spec_from_file_location("expression_parser", path)
+        generated = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(generated)
+
+    print(f"{'tokens':>10} {'run (s)':>10} {'compiled (s)':>13} {'generated (s)':>14} {'speedup':>8}")
+    for size in sizes:
+        sentence: List[str] = expression(size)
+        run: float = best_of(lambda: automata.run(sentence))
+        compiled: float = best_of(lambda: automata.run_compiled(sentence))
+        module: float = best_of(lambda: generated.parse(sentence))
+        print(f"{len(sentence):>10} {run:>10.4f} {compiled:>13.4f} {module:>14.4f} {run / module:>7.1f}x")
+
+    return None
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1000, 10000, 100000])
@@ -0,0 +1,24 @@
+import sys
+from time import perf_counter
+from typing import List
+
+from benchmarks.families import left_recursive_chain, wide_alternation
+from utils.model.Grammar import NonContextGrammar
+
+
+def main(sizes: List[int]) -> None:
+    # Cadeia: poucas produções por não terminal; alternância larga: um não terminal com `size` produções.
+    print(f"{'family':>22} {'size':>6} {'seconds':>10} {'us/size':>10}")
+    for family in (left_recursive_chain, wide_alternation):
+        for size in sizes:
+            grammar = NonContextGrammar(family(size)[0])
+            start: float = perf_counter()
+            grammar._eliminate_left_recursion()
+            elapsed: float = perf_counter() - start
+            print(f"{family.__name__:>22} {size:>6} {elapsed:>10.4f} {elapsed / size * 1e6:>10.1f}")
+
+    return None
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [250, 500, 1000, 2000, 4000])
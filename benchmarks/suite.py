@@ -0,0 +1,133 @@
+import argparse
+import json
+import platform
+import sys
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.families import FAMILIES
+from utils.model.Grammar import NonContextGrammar
+from utils.model.PushdownAutomata import PushDownAutomata
+
+
+BASELINE_VERSION: int = 1
+DEFAULT_SIZES: List[int] = [25, 50, 100, 200]
+# Etapas medidas, na ordem em que são executadas sobre a mesma gramática.
+STAGES: List[str] = ["eliminate_left_recursion", "left_factoring", "first", "follow",
+                     "analysis_table", "run", "run_compiled"]
+
+# family -> tamanho (str, por causa do JSON) -> etapa -> segundos
+Results = Dict[str, Dict[str, Dict[str, float]]]
+
+
+def _timed(function: Callable[[], object]) -> float:
+    start: float = perf_counter()
+    function()
+    return perf_counter() - start
+
+
+def measure(grammar_input: str, sentence: List[str]) -> Dict[str, float]:
+    # Cada etapa altera a gramática, então uma nova instância é criada a cada medição.
+    grammar = NonContextGrammar(grammar_input)
+    timings: Dict[str, float] = {
+        "eliminate_left_recursion": _timed(grammar._eliminate_left_recursion),
+        "left_factoring": _timed(grammar._left_factoring),
+        "first": _timed(grammar._set_first),
+        "follow": _timed(grammar._set_follow),
+        "analysis_table": _timed(grammar.construct_analysis_table),
+    }
+    automata = PushDownAutomata(grammar.get_initial_state(),
+                                grammar.construct_analysis_table(),
+                                grammar.get_symbol_table())
+    automata.compile()
+    timings["run"] = _timed(lambda: automata.run(sentence))
+    timings["run_compiled"] = _timed(lambda: automata.run_compiled(sentence))
+    if not automata.run(sentence):
+        raise AssertionError("The benchmark sentence was rejected")
+
+    return timings
+
+
+def run_suite(families: List[str], sizes: List[int], repeat: int = 3) -> Results:
+    results: Results = dict()
+    for family in families:
+        results[family] = dict()
+        for size in sizes:
+            grammar_input, sentence = FAMILIES[family](size)
+            best: Dict[str, float] = dict()
+            for _ in range(repeat):
+                for stage, elapsed in measure(grammar_input, sentence).items():
+                    best[stage] = min(elapsed, best.get(stage, elapsed))
+            results[family][str(size)] = best
+            print(f"{family:>22} {size:>6} " + " ".join(f"{best[stage]:>10.4f}" for stage in STAGES))
+
+    return results
+
+
+def save_baseline(path: str, results: Results) -> None:
+    with open(path, "w") as baseline_file:
+        json.dump({"version": BASELINE_VERSION,
+                   "python": platform.python_version(),
+                   "results": results}, baseline_file, indent=2, sort_keys=True)
+
+    return None
+
+
+def load_baseline(path: str) -> Results:
+    with open(path) as baseline_file:
+        baseline: Dict = json.load(baseline_file)
+
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {baseline.get('version')}")
+
+    return baseline["results"]
+
+
+def compare(baseline: Results, results: Results, threshold: float, min_seconds: float) -> List[str]:
+    # Uma regressão é uma etapa ao menos `threshold` vezes mais lenta que no baseline; etapas abaixo de
+    # `min_seconds` nas duas medições são ignoradas, pois ficam dominadas por ruído.
+    regressions: List[str] = list()
+    for family, sizes in results.items():
+        for size, timings in sizes.items():
+            previous: Dict[str, float] = baseline.get(family, {}).get(size, {})
+            for stage, elapsed in timings.items():
+                if stage not in previous or max(elapsed, previous[stage]) < min_seconds:
+                    continue
+                ratio: float = elapsed / max(previous[stage], 1e-9)
+                if ratio >= threshold:
+                    regressions.append(f"{family} size={size} {stage}: "
+                                       f"{previous[stage]:.4f}s -> {elapsed:.4f}s ({ratio:.2f}x)")
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de conversão e análise em famílias de gramáticas.")
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--family", action="append", choices=sorted(FAMILIES),
+                        help="família a medir (pode ser repetida); todas por padrão")
+    parser.add_argument("--repeat", type=int, default=3, help="medições por tamanho (vale a menor)")
+    parser.add_argument("--save", metavar="PATH", help="grava os resultados como baseline JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compara os resultados com um baseline JSON")
+    parser.add_argument("--threshold", type=float, default=1.5, help="razão a partir da qual há regressão")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="tempo abaixo do qual não se compara")
+    args = parser.parse_args(argv)
+
+    print(f"{'family':>22} {'size':>6} " + " ".join(f"{stage[:10]:>10}" for stage in STAGES))
+    results: Results = run_suite(args.family or list(FAMILIES), args.sizes, args.repeat)
+    if args.save:
+        save_baseline(args.save, results)
+
+    if args.compare:
+        regressions: List[str] = compare(load_baseline(args.compare), results, args.threshold, args.min_seconds)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions against the baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
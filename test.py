@@ -1,7 +1,15 @@
 import unittest
 
+from tests.CliTests import CliTests
+from tests.controller_tests.WorkerTests import WorkerTests
+from tests.model_tests.GrammarCacheTests import GrammarCacheTests
+from tests.model_tests.GrammarRegistryTests import GrammarRegistryTests
+from tests.model_tests.LexerTests import LexerTests
 from tests.model_tests.NonContextGrammarTests import NonContextGrammarTests
+from tests.model_tests.PushDownAutomataTests import PushDownAutomataTests
+from tests.ServerTests import ServerTests
 from tests.UtilsTests import UtilsTests
+from tests.view_tests.AnalysisTableViewTests import AnalysisTableViewTests
 
 if __name__ == "__main__":
     unittest.main()
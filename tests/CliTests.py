@@ -0,0 +1,97 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from utils.cli import main
+
+
+class CliTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.grammar_path = os.path.join(self.directory.name, "grammar.txt")
+        with open(self.grammar_path, "w") as grammar_file:
+            grammar_file.write("E -> E + T\n"
+                               "E -> T\n"
+                               "T -> T * F\n"
+                               "T -> F\n"
+                               "F -> ( E )\n"
+                               "F -> id\n")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _main(self, argv, stdin: str = ""):
+        stdout = io.StringIO()
+        code = main(["--cache-dir", self.directory.name] + argv, io.StringIO(stdin), stdout)
+        return code, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    # @unittest.skip("")
+    def test_check(self) -> None:
+        code, records = self._main(["check", self.grammar_path])
+        self.assertEqual(0, code)
+        self.assertTrue(records[0]["ll1"])
+        self.assertEqual("E", records[0]["initial_state"])
+        return None
+
+    # @unittest.skip("")
+    def test_table(self) -> None:
+        code, records = self._main(["--no-cache", "table", self.grammar_path])
+        self.assertEqual(0, code)
+        cells = {(record["non_terminal"], record["terminal"]): record["production"] for record in records}
+        self.assertEqual(["(", "E", ")"], cells[("F", "(")])
+        self.assertEqual(["id"], cells[("F", "id")])
+        return None
+
+    # @unittest.skip("")
+    def test_parse(self) -> None:
+        code, records = self._main(["parse", self.grammar_path], "id + id * id\n\n( id + id\nid\n")
+        self.assertEqual(1, code)
+        self.assertEqual([{"line": 1, "accepted": True},
+                          {"line": 3, "accepted": False},
+                          {"line": 4, "accepted": True}], records)
+
+        tokens_path = os.path.join(self.directory.name, "tokens.txt")
+        with open(tokens_path, "w") as tokens_file:
+            tokens_file.write("( id )\n")
+        code, records = self._main(["parse", self.grammar_path, tokens_path])
+        self.assertEqual(0, code)
+        self.assertEqual([{"line": 1, "accepted": True}], records)
+
+        code, records = self._main(["parse", "--recover", self.grammar_path], "id + id\nid + * id * ( id\n")
+        self.assertEqual(1, code)
+        self.assertEqual([], records[0]["errors"])
+        self.assertFalse(records[1]["accepted"])
+        self.assertEqual([2, 7], [error["position"] for error in records[1]["errors"]])
+        return None
+
+    # @unittest.skip("")
+    def test_read_errors(self) -> None:
+        missing_path = os.path.join(self.directory.name, "missing.txt")
+        code, records = self._main(["parse", self.grammar_path, missing_path])
+        self.assertEqual(2, code)
+        self.assertIn("error", records[0])
+
+        code, records = self._main(["check", missing_path])
+        self.assertEqual(2, code)
+        self.assertIn("error", records[0])
+
+        for grammar_input in ("", "\n  \n", "E -> id\nT\n", "E id"):
+            with open(self.grammar_path, "w") as grammar_file:
+                grammar_file.write(grammar_input)
+            code, records = self._main(["--no-cache", "check", self.grammar_path])
+            self.assertEqual(2, code, grammar_input)
+            self.assertIn("error", records[0])
+        return None
+
+    # @unittest.skip("")
+    def test_does_not_import_view(self) -> None:
+        script = "import sys, utils.cli; " \
+                 "print(any(name == 'tkinter' or name.startswith('utils.view') for name in sys.modules))"
+        output = subprocess.check_output([sys.executable, "-c", script],
+                                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(b"False", output.strip())
+        return None
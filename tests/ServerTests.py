@@ -0,0 +1,92 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from utils.model.GrammarRegistry import GrammarRegistry
+from utils.server import ParseClient, ParseServer
+
+
+class ServerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grammar_input = "E -> E + T\n" \
+                             "E -> T\n" \
+                             "T -> T * F\n" \
+                             "T -> F\n" \
+                             "F -> ( E )\n" \
+                             "F -> id"
+
+    def _run(self, scenario) -> None:
+        async def main() -> None:
+            server = ParseServer(GrammarRegistry(max_entries=4), workers=2)
+            listening = await server.start_tcp("127.0.0.1", 0)
+            port = listening.sockets[0].getsockname()[1]
+            try:
+                await scenario(lambda: ParseClient.connect_tcp("127.0.0.1", port))
+            finally:
+                await server.close()
+
+        asyncio.run(main())
+        return None
+
+    # @unittest.skip("")
+    def test_register_and_parse(self) -> None:
+        async def scenario(connect) -> None:
+            async with await connect() as client:
+                registered = await client.register(self.grammar_input, name="expr",
+                                                   token_classes={"id": r"[a-z]\w*"})
+                self.assertTrue(registered["ok"])
+                self.assertTrue(registered["ll1"])
+                self.assertEqual([], registered["conflicts"])
+
+                self.assertTrue((await client.parse("expr", tokens=["id", "+", "id"]))["accepted"])
+                self.assertFalse((await client.parse("expr", tokens=["id", "+"]))["accepted"])
+                self.assertTrue((await client.parse(registered["fingerprint"], text="a * (b + c)"))["accepted"])
+
+                recovered = await client.parse("expr", text="a + * b * ( c", recover=True)
+                self.assertFalse(recovered["accepted"])
+                self.assertEqual([2, 7], [error["position"] for error in recovered["errors"]])
+
+                unknown = await client.parse("missing", tokens=[])
+                self.assertFalse(unknown["ok"])
+                invalid = await client.parse("expr", text="a ? b")
+                self.assertFalse(invalid["ok"])
+                self.assertEqual(1, (await client.stats())["entries"])
+
+        self._run(scenario)
+        return None
+
+    # @unittest.skip("")
+    def test_many_clients(self) -> None:
+        async def client_session(connect, index: int) -> bool:
+            async with await connect() as client:
+                await client.register(self.grammar_input, name="expr")
+                sentence = ["id"] + ["+", "id"] * index
+                return (await client.parse("expr", tokens=sentence))["accepted"]
+
+        async def scenario(connect) -> None:
+            results = await asyncio.gather(*(client_session(connect, index) for index in range(20)))
+            self.assertEqual([True] * 20, results)
+            async with await connect() as client:
+                stats = await client.stats()
+                self.assertEqual(1, stats["entries"])
+
+        self._run(scenario)
+        return None
+
+    @unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "Unix sockets are not available")
+    def test_unix_socket(self) -> None:
+        async def main() -> None:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "parser.sock")
+                server = ParseServer()
+                await server.start_unix(path)
+                try:
+                    async with await ParseClient.connect_unix(path) as client:
+                        await client.register("S -> a S\nS -> b", name="s")
+                        self.assertTrue((await client.parse("s", tokens=["a", "a", "b"]))["accepted"])
+                finally:
+                    await server.close()
+
+        asyncio.run(main())
+        return None
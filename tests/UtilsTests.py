@@ -4,74 +4,6 @@ import unittest
 
 
 class UtilsTests(unittest.TestCase):
-    # @unittest.skip("")
-    def test_common_prefix_size(self) -> None:
-        prefix1 = ('i', 'E', 't', 'S')
-        prefix2 = ('i', 'E', 't', 'S', 'e', 'S')
-        expected = 4
-        actual = common_prefix_size(prefix1, prefix2)
-        self.assertEqual(expected, actual)
-
-        prefix1 = ('c', 'C')
-        prefix2 = ('a', 'D')
-        expected = 0
-        actual = common_prefix_size(prefix1, prefix2)
-        self.assertEqual(expected, actual)
-
-        prefix1 = ('e', 'C')
-        prefix2 = ('e', 'A')
-        expected = 1
-        actual = common_prefix_size(prefix1, prefix2)
-        self.assertEqual(expected, actual)
-        return None
-
-    # @unittest.skip("")
-    def test_find_longest_prefix(self) -> None:
-        productions = [('a',), ('i', 'E', 't', 'S', 'e', 'S'), ('i', 'E', 't', 'S')]
-        expected = ('i', 'E', 't', 'S')
-        actual = find_longest_common_prefix(productions)
-        self.assertEqual(expected, actual)
-
-        productions = [('a', 'D'), ('c', 'C')]
-        expected = tuple()
-        actual = find_longest_common_prefix(productions)
-        self.assertEqual(expected, actual)
-
-        productions = [('e', 'A'), ('e', 'C')]
-        expected = ('e',)
-        actual = find_longest_common_prefix(productions)
-        self.assertEqual(expected, actual)
-
-        production = [
-            ('f', 'o', 'o'),
-            ('f', 'o', 'o', 'b', 'a', 'r'),
-            ('f', 'o', 'o', 't', 'b', 'a', 'l', 'l'),
-            ('f', 'o', 'o', 't', 'b', 'a', 'g'),
-            ('b', 'a', 'r'),
-        ]
-        expected = ('f', 'o', 'o', 't', 'b', 'a')
-        actual = find_longest_common_prefix(production)
-        self.assertEqual(expected, actual)
-        return None
-
-    # @unittest.skip("")
-    def test_add_factored_transition(self) -> None:
-        new_transitions = {("S'", ('&',))}
-        production = ('i', 'E', 't', 'S', 'e', 'S')
-        prefix = ('i', 'E', 't', 'S')
-        new_non_terminal = "S'"
-        new_transitions = {("S'", ('e', 'S')), ("S'", ('&',))}
-
-        expected = {("S'", ('e', 'S')), ("S'", ('&',))}
-        actual = add_factored_transition(
-            new_transitions,
-            production,
-            prefix,
-            new_non_terminal,
-        )
-        self.assertEqual(expected, actual)
-        return None
-
     # @unittest.skip("")
     def test_get_new_body(self) -> None:
         production = ('c', 'C')
@@ -132,6 +64,25 @@ class UtilsTests(unittest.TestCase):
         self.assertTrue(should_replace(productions, non_terminals))
         return None
 
+    def test_prefix_trie(self) -> None:
+        productions = [("a", "b", "c"), ("a", "b", "d"), ("a", "e"), ("f",), ("&",)]
+        trie = build_prefix_trie(productions)
+        self.assertEqual({PRODUCTION_END, "a", "f"}, set(trie))
+        self.assertTrue(is_trie_leaf(trie["f"]))
+        self.assertTrue(has_common_prefix(trie))
+
+        prefix, node = follow_trie_path("a", trie["a"])
+        self.assertEqual(("a",), prefix)
+        self.assertEqual({"b", "e"}, set(node))
+        prefix, node = follow_trie_path("b", node["b"])
+        self.assertEqual(("b",), prefix)
+        self.assertEqual({"c", "d"}, set(node))
+
+        trie = build_prefix_trie([("i", "E", "t", "S"), ("a",)])
+        self.assertFalse(has_common_prefix(trie))
+        self.assertEqual((("i", "E", "t", "S"), {PRODUCTION_END: {}}), follow_trie_path("i", trie["i"]))
+        return None
+
     @unittest.skip("")
     def test_latex_table(self) -> None:
         latex_analysis_table({"S", "A"}, {"a", "b"}, {})
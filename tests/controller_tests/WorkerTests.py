@@ -0,0 +1,124 @@
+import time
+import unittest
+from threading import Event
+
+from utils.controller.Worker import Worker
+from utils.model.GrammarRegistry import GrammarRegistry
+
+
+class FakeWidget:
+    # Substitui o Tk: guarda as chamadas de after() para o teste executá-las.
+    def __init__(self) -> None:
+        self.pending = list()
+
+    def after(self, _: int, callback, *args) -> None:
+        self.pending.append((callback, args))
+        return None
+
+    def run_until_idle(self, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self.pending and time.monotonic() < deadline:
+            callback, args = self.pending.pop(0)
+            callback(*args)
+            time.sleep(0.001)
+        return None
+
+
+class WorkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.widget = FakeWidget()
+        self.progress = list()
+        self.worker = Worker(self.widget, on_progress=self.progress.append, interval=1)
+        self.results = list()
+        self.errors = list()
+
+    def test_done(self) -> None:
+        def work(job) -> int:
+            job.report("working")
+            return 42
+
+        self.worker.submit(work, on_done=self.results.append, on_error=self.errors.append)
+        self.assertTrue(self.worker.is_busy())
+        self.widget.run_until_idle()
+        self.assertEqual([42], self.results)
+        self.assertEqual([], self.errors)
+        self.assertFalse(self.worker.is_busy())
+        return None
+
+    def test_error(self) -> None:
+        def work(_) -> None:
+            raise ValueError("broken")
+
+        self.worker.submit(work, on_done=self.results.append, on_error=self.errors.append)
+        self.widget.run_until_idle()
+        self.assertEqual([], self.results)
+        self.assertIsInstance(self.errors[0], ValueError)
+        return None
+
+    def test_cancel(self) -> None:
+        started = Event()
+
+        def work(job) -> None:
+            started.set()
+            while True:
+                job.report("still working")
+                time.sleep(0.001)
+
+        job = self.worker.submit(work, on_done=self.results.append, on_error=self.errors.append)
+        started.wait(5)
+        self.assertTrue(self.worker.cancel())
+        self.assertTrue(job.is_cancelled())
+        self.widget.run_until_idle()
+        self.assertEqual([], self.results)
+        self.assertEqual([], self.errors)
+        self.assertEqual("Cancelado", self.progress[-1])
+        self.assertFalse(self.worker.cancel())
+        return None
+
+    def test_submit_replaces_running_job(self) -> None:
+        def slow(job) -> str:
+            while True:
+                job.report("slow")
+                time.sleep(0.001)
+
+        first = self.worker.submit(slow, on_done=self.results.append, on_error=self.errors.append)
+        self.worker.submit(lambda job: "fast", on_done=self.results.append, on_error=self.errors.append)
+        self.widget.run_until_idle()
+        self.assertTrue(first.is_cancelled())
+        self.assertEqual(["fast"], self.results)
+        return None
+
+    def test_cancel_during_conversion_stage(self) -> None:
+        # O cancelamento chega no início do FIRST e interrompe a etapa num ponto de verificação,
+        # sem esperar que ela termine (o FOLLOW nunca começa).
+        # N_i -> M_i N_(i+1),  M_i -> a_i | &
+        size = 3000
+        grammar_input = "\n".join([f"N{i} -> M{i} N{i + 1}\nM{i} -> a{i}\nM{i} -> &" for i in range(size)]
+                                  + [f"N{size} -> end"])
+        stages = list()
+        checkpoints = list()
+
+        def on_stage(job, stage: str) -> None:
+            stages.append(stage)
+            if stage == "first":
+                job.cancel()
+            return None
+
+        def on_checkpoint(job) -> None:
+            checkpoints.append(stages[-1])
+            job.check_cancelled()
+            return None
+
+        def work(job):
+            return GrammarRegistry().compile(grammar_input,
+                                             on_stage=lambda stage: on_stage(job, stage),
+                                             on_checkpoint=lambda: on_checkpoint(job))
+
+        job = self.worker.submit(work, on_done=self.results.append, on_error=self.errors.append)
+        kind, _ = job.get_messages().get(timeout=30)
+        self.assertEqual("cancelled", kind)
+        self.assertEqual(["eliminate_left_recursion", "left_factoring", "first"], stages)
+        self.assertEqual(["first"], checkpoints[-1:])
+        self.assertEqual([], self.results)
+        self.assertEqual([], self.errors)
+        return None
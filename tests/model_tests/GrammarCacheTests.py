@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.model.Grammar import NonContextGrammar
+from utils.model.GrammarCache import GrammarCache, grammar_fingerprint
+
+
+class GrammarCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = GrammarCache(self.directory.name)
+        self.grammar_input = "E -> E + T\n" \
+                             "E -> T\n" \
+                             "T -> T * F\n" \
+                             "T -> F\n" \
+                             "F -> ( E )\n" \
+                             "F -> id"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_fingerprint(self) -> None:
+        reordered = "E -> T\n" \
+                    "T ->   F\n\n" \
+                    "E -> E + T \n" \
+                    "T -> T * F\n" \
+                    "F -> id\n" \
+                    "F -> ( E )"
+        self.assertEqual(grammar_fingerprint(self.grammar_input), grammar_fingerprint(reordered))
+        other_start = "T -> F\n" + self.grammar_input
+        self.assertNotEqual(grammar_fingerprint(self.grammar_input), grammar_fingerprint(other_start))
+        return None
+
+    def test_store_and_load(self) -> None:
+        self.assertIsNone(self.cache.load(self.grammar_input))
+        grammar = NonContextGrammar(self.grammar_input)
+        grammar.convert_grammar()
+        self.cache.store(self.grammar_input, grammar)
+        self.assertTrue(os.path.exists(self.cache.get_path(self.grammar_input)))
+
+        loaded = self.cache.load(self.grammar_input)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(grammar.get_initial_state(), loaded.get_initial_state())
+        self.assertEqual(grammar.get_transitions(), loaded.get_transitions())
+        self.assertEqual(grammar.get_non_terminals(), loaded.get_non_terminals())
+        self.assertEqual(grammar.get_terminals(), loaded.get_terminals())
+        self.assertEqual(grammar.get_first(), loaded.get_first())
+        self.assertEqual(grammar.get_follow(), loaded.get_follow())
+        self.assertEqual(grammar.construct_analysis_table(), loaded.construct_analysis_table())
+        self.assertEqual(grammar.is_ll1(), loaded.is_ll1())
+        self.assertEqual(grammar.get_conflicts(), loaded.get_conflicts())
+        self.assertEqual(grammar.get_symbol_table().get_names(), loaded.get_symbol_table().get_names())
+        return None
+
+    def test_invalid_entry_is_a_miss(self) -> None:
+        os.makedirs(self.directory.name, exist_ok=True)
+        with open(self.cache.get_path(self.grammar_input), "w") as cache_file:
+            cache_file.write("{not json")
+        self.assertIsNone(self.cache.load(self.grammar_input))
+
+        grammar = self.cache.load_or_convert(self.grammar_input)
+        self.assertTrue(grammar.is_ll1())
+        self.assertIsNotNone(self.cache.load(self.grammar_input))
+        return None
+
+    def test_corrupted_entry_is_a_miss(self) -> None:
+        grammar = NonContextGrammar(self.grammar_input)
+        grammar.convert_grammar()
+        self.cache.store(self.grammar_input, grammar)
+        path = self.cache.get_path(self.grammar_input)
+        with open(path) as cache_file:
+            entry = json.load(cache_file)
+
+        for key, value in (("first", []), ("analysis_table", {"E": []}), ("transitions", [1]), ("conflicts", None)):
+            corrupted = dict(entry, grammar=dict(entry["grammar"], **{key: value}))
+            with open(path, "w") as cache_file:
+                json.dump(corrupted, cache_file)
+            self.assertIsNone(self.cache.load(self.grammar_input), key)
+
+        self.assertTrue(self.cache.load_or_convert(self.grammar_input).is_ll1())
+        return None
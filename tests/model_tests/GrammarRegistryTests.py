@@ -0,0 +1,57 @@
+import unittest
+
+from utils.model.GrammarRegistry import GrammarRegistry
+from utils.model.GrammarCache import grammar_fingerprint
+
+
+class GrammarRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grammar_inputs = [
+            "E -> E + T\nE -> T\nT -> id",
+            "S -> a S\nS -> b",
+            "P -> K V\nK -> c K\nK -> &\nV -> v",
+            "S -> i E t S\nS -> i E t S e S\nS -> a\nE -> b",
+        ]
+
+    def test_register_and_get(self) -> None:
+        registry = GrammarRegistry(max_entries=4)
+        compiled = registry.register(self.grammar_inputs[0], name="expressions")
+        self.assertTrue(compiled.is_ll1())
+        self.assertTrue(compiled.get_automata().run_compiled(["id", "+", "id"]))
+        self.assertIs(compiled, registry.get("expressions"))
+        self.assertIs(compiled, registry.get(grammar_fingerprint(self.grammar_inputs[0])))
+        self.assertIs(compiled, registry.register(self.grammar_inputs[0] + "\n"))
+        self.assertIsNone(registry.get("unknown"))
+
+        not_ll1 = registry.register(self.grammar_inputs[3])
+        self.assertFalse(not_ll1.is_ll1())
+        self.assertIsNone(not_ll1.get_automata())
+
+        stats = registry.get_stats()
+        self.assertEqual(2, stats["entries"])
+        self.assertEqual(3, stats["hits"])
+        self.assertEqual(3, stats["misses"])
+        self.assertGreater(stats["bytes"], 0)
+        return None
+
+    def test_eviction(self) -> None:
+        registry = GrammarRegistry(max_entries=2)
+        registry.register(self.grammar_inputs[0], name="first")
+        registry.register(self.grammar_inputs[1], name="second")
+        registry.get("first")
+        registry.register(self.grammar_inputs[2], name="third")
+        self.assertIn("first", registry)
+        self.assertNotIn("second", registry)
+        self.assertIn("third", registry)
+        self.assertEqual(1, registry.get_stats()["evictions"])
+
+        registry = GrammarRegistry(max_entries=10, max_bytes=1)
+        for grammar_input in self.grammar_inputs:
+            registry.register(grammar_input)
+        self.assertEqual(1, len(registry))
+        self.assertEqual(3, registry.get_stats()["evictions"])
+
+        registry.remove(grammar_fingerprint(self.grammar_inputs[3]))
+        self.assertEqual(0, len(registry))
+        self.assertEqual(0, registry.get_stats()["bytes"])
+        return None
@@ -0,0 +1,54 @@
+import unittest
+
+from utils.model.Grammar import NonContextGrammar
+from utils.model.Lexer import Lexer, LexerError
+from utils.model.PushdownAutomata import PushDownAutomata
+
+
+class LexerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grammar = NonContextGrammar("E -> E + T\n"
+                                         "E -> T\n"
+                                         "T -> T * F\n"
+                                         "T -> F\n"
+                                         "F -> ( E )\n"
+                                         "F -> id\n"
+                                         "F -> num")
+        self.grammar.convert_grammar()
+        self.lexer = Lexer.from_grammar(self.grammar, {"id": r"[A-Za-z_]\w*", "num": r"\d+"})
+
+    def test_scan(self) -> None:
+        expected = [("id", "x1", 0), ("+", "+", 3), ("(", "(", 5), ("num", "42", 6),
+                    ("*", "*", 8), ("id", "y", 9), (")", ")", 10)]
+        self.assertEqual(expected, list(self.lexer.scan("x1 + (42*y)")))
+        self.assertEqual(["id", "+", "num"], list(self.lexer.tokenize(b"x1+42")))
+        self.assertEqual([], list(self.lexer.tokenize("  \n\t")))
+        return None
+
+    def test_literals(self) -> None:
+        lexer = Lexer({"if", "then", "=", "==", "id", "&"}, {"id": r"[a-z]+"})
+        self.assertEqual(["then", "==", "if", "="], lexer.get_literals())
+        self.assertEqual(["if", "id", "==", "id", "then", "id", "=", "id"],
+                         list(lexer.tokenize("if iffy == x then x = y")))
+
+        # Sem classes de token, a entrada separada por espaços continua funcionando.
+        lexer = Lexer({"c", "com", ";"})
+        self.assertEqual(["com", ";", "c", "c"], list(lexer.tokenize("com ; c c")))
+        return None
+
+    def test_error(self) -> None:
+        tokens = self.lexer.tokenize("x + ? y")
+        self.assertEqual(["id", "+"], [next(tokens), next(tokens)])
+        with self.assertRaises(LexerError) as context:
+            next(tokens)
+        self.assertEqual(4, context.exception.position)
+        return None
+
+    def test_feeds_parser(self) -> None:
+        automata = PushDownAutomata(self.grammar.get_initial_state(),
+                                    self.grammar.construct_analysis_table(),
+                                    self.grammar.get_symbol_table())
+        self.assertTrue(automata.run(self.lexer.tokenize("a * (b + 12)")))
+        self.assertTrue(automata.run_compiled(self.lexer.tokenize(b"a*(b+12)")))
+        self.assertFalse(automata.run(self.lexer.tokenize("a * (b + 12")))
+        return None
@@ -480,3 +480,206 @@ class NonContextGrammarTests(unittest.TestCase):
         self.default_grammar1.convert_grammar()
         self.assertTrue(self.default_grammar1.is_ll1())
         return None
+
+    def test_conflicts(self) -> None:
+        self.default_grammar1.convert_grammar()
+        self.assertEqual({}, self.default_grammar1.get_conflicts())
+
+        # else pendente: depois da fatoração, "e" está em FIRST(e S) e em FOLLOW do novo não terminal.
+        grammar = NonContextGrammar(self.default_grammar_input0)
+        grammar.convert_grammar()
+        self.assertFalse(grammar.is_ll1())
+        conflicts = grammar.get_conflicts()
+        self.assertEqual(1, len(conflicts))
+        (state, terminal), bodies = next(iter(conflicts.items()))
+        self.assertEqual("e", terminal)
+        self.assertEqual([("&",), ("e", "S")], bodies)
+        self.assertIn(grammar.construct_analysis_table()[state][terminal], bodies)
+
+        # conflito FIRST/FIRST sem produção vazia, que a verificação antiga não via
+        grammar = NonContextGrammar("S -> A\nS -> B\nA -> a\nB -> a")
+        grammar._set_first()
+        grammar._set_follow()
+        self.assertFalse(grammar.is_ll1())
+        self.assertEqual({("S", "a"): [("A",), ("B",)]}, grammar.get_conflicts())
+        return None
+
+    def test_production_index(self) -> None:
+        grammar_input = "S -> S c \n" \
+                        "S -> A a \n" \
+                        "S -> c \n" \
+                        "A -> S a \n" \
+                        "A -> B b \n" \
+                        "A -> a \n" \
+                        "B -> S c \n" \
+                        "B -> B b"
+        for grammar in (NonContextGrammar(grammar_input), self.default_grammar1, self.default_grammar2):
+            grammar.convert_grammar()
+            transitions = grammar.get_transitions()
+            for non_terminal in grammar.get_non_terminals():
+                expected = {body for head, body in transitions if head == non_terminal}
+                self.assertEqual(expected, grammar.get_all_productions_of_state(non_terminal))
+            for symbol in grammar.get_non_terminals() | grammar.get_terminals():
+                expected = {transition for transition in transitions if symbol in transition[1]}
+                self.assertEqual(expected, grammar.get_transitions_using(symbol))
+        return None
+
+    def test_first_and_follow_linear_on_chains(self) -> None:
+        # Cadeias acíclicas saem numa passada por não terminal, sem reprocessar a cadeia a cada mudança.
+        size = 300
+        # N_i -> M_i N_(i+1),  M_i -> a_i | &
+        cascade = [f"N{i} -> M{i} N{i + 1}\nM{i} -> a{i}\nM{i} -> &" for i in range(size)] + [f"N{size} -> end"]
+        # A_i -> b_i A_(i-1) | A_i c_i   (A_0 -> b_0 | A_0 c_0)
+        chain = [f"A{i} -> b{i} A{i - 1}\nA{i} -> A{i} c{i}" for i in reversed(range(1, size))]
+        chain.append("A0 -> b0\nA0 -> A0 c0")
+        for grammar_input in (cascade, chain):
+            grammar = NonContextGrammar("\n".join(grammar_input), collect_stats=True)
+            grammar.convert_grammar()
+            stats = grammar.get_stats()
+            non_terminals = len(grammar.get_non_terminals())
+            self.assertLessEqual(stats.get_stage("first").get_counter("iterations"), 2 * non_terminals)
+            self.assertLessEqual(stats.get_stage("follow").get_counter("iterations"), 2 * non_terminals)
+        return None
+
+    def test_first_and_follow_mutual_recursion(self) -> None:
+        grammar_input = "S -> i E t S F \n" \
+                        "S -> a \n" \
+                        "F -> e S \n" \
+                        "F -> & \n" \
+                        "E -> b"
+        grammar = NonContextGrammar(grammar_input)
+        grammar._set_first()
+        grammar._set_follow()
+        self.assertEqual({"S": {"i", "a"}, "F": {"e", "&"}, "E": {"b"}}, grammar.get_first())
+        self.assertEqual({"S": {"$", "e"}, "F": {"$", "e"}, "E": {"t"}}, grammar.get_follow())
+
+        grammar_input = "E -> E + T\n" \
+                        "E -> T\n" \
+                        "T -> T * F\n" \
+                        "T -> F\n" \
+                        "F -> ( E )\n" \
+                        "F -> id"
+        grammar = NonContextGrammar(grammar_input)
+        grammar.convert_grammar()
+        self.assertEqual({"E": {"(", "id"},
+                          "T": {"(", "id"},
+                          "F": {"(", "id"},
+                          "U": {"+", "&"},
+                          "V": {"*", "&"}}, grammar.get_first())
+        self.assertEqual({"E": {"$", ")"},
+                          "T": {"$", ")", "+"},
+                          "F": {"$", ")", "+", "*"},
+                          "U": {"$", ")"},
+                          "V": {"$", ")", "+"}}, grammar.get_follow())
+        self.assertTrue(grammar.is_ll1())
+        return None
+
+    def test_factor_all_shared_prefixes(self) -> None:
+        grammar_input = "S -> a b c\n" \
+                        "S -> a b d\n" \
+                        "S -> a e\n" \
+                        "S -> B\n" \
+                        "B -> x"
+        grammar = NonContextGrammar(grammar_input)
+        grammar._remove_direct_non_determinism()
+        expected = {
+            ("S", ("a", "C")),
+            ("S", ("B",)),
+            ("C", ("b", "D")),
+            ("C", ("e",)),
+            ("D", ("c",)),
+            ("D", ("d",)),
+            ("B", ("x",)),
+        }
+        self.assertEqual(expected, grammar.get_transitions())
+        self.assertEqual({"S", "B", "C", "D"}, grammar.get_non_terminals())
+        return None
+
+    def test_substitute_wide_alternation(self) -> None:
+        # S -> A_i x_i, A_i -> a_i: cada corpo de S é substituído uma única vez.
+        size = 300
+        grammar_input = "\n".join([f"S -> A{i} x{i}" for i in range(size)] + [f"A{i} -> a{i}" for i in range(size)])
+        grammar = NonContextGrammar(grammar_input, collect_stats=True)
+        grammar._run_stage("eliminate_left_recursion", grammar._eliminate_left_recursion)
+        self.assertEqual({(f"a{i}", f"x{i}") for i in range(size)}, grammar.get_all_productions_of_state("S"))
+        stage = grammar.get_stats().get_stage("eliminate_left_recursion")
+        self.assertEqual(size, stage.get_counter("productions_removed"))
+        return None
+
+    def test_factor_deeply_nested_prefixes(self) -> None:
+        # S -> p0 | p0 p1 | ... | p0 ... p1199: cada prefixo vira uma bifurcação aninhada na trie.
+        size = 1200
+        grammar_input = "\n".join("S -> " + " ".join(f"p{j}" for j in range(i + 1)) for i in range(size))
+        grammar = NonContextGrammar(grammar_input)
+        grammar.convert_grammar()
+        self.assertEqual(size, len(grammar.get_non_terminals()))
+        self.assertTrue(grammar.is_ll1())
+        return None
+
+    def test_replace_leading_non_terminals_once(self) -> None:
+        grammar_input = "B -> X x\n" \
+                        "B -> Y y\n" \
+                        "X -> a\n" \
+                        "Y -> a z"
+        grammar = NonContextGrammar(grammar_input)
+        grammar._left_factoring()
+        self.assertEqual({("a", "Z")}, grammar.get_all_productions_of_state("B"))
+        self.assertEqual({("x",), ("z", "y")}, grammar.get_all_productions_of_state("Z"))
+
+        size = 300
+        grammar_input = "\n".join([f"B -> X{i} x{i}" for i in range(size)] + [f"X{i} -> a{i}" for i in range(size)])
+        grammar = NonContextGrammar(grammar_input, collect_stats=True)
+        grammar._run_stage("left_factoring", grammar._left_factoring)
+        self.assertEqual({(f"a{i}", f"x{i}") for i in range(size)}, grammar.get_all_productions_of_state("B"))
+        self.assertEqual(size, grammar.get_stats().get_stage("left_factoring").get_counter("productions_removed"))
+        return None
+
+    def test_multi_character_symbols(self) -> None:
+        grammar_input = "Expr -> Expr + Term\n" \
+                        "Expr -> Term\n" \
+                        "Term -> id\n" \
+                        "Term -> ( Expr )"
+        grammar = NonContextGrammar(grammar_input)
+        self.assertEqual("Expr", grammar.get_initial_state())
+        grammar.convert_grammar()
+        self.assertTrue(grammar.is_ll1())
+        self.assertEqual({"Expr", "Term", "A"}, grammar.get_non_terminals())
+        self.assertEqual({"$", "&", "Expr", "Term", "A"} | grammar.get_terminals(),
+                         set(grammar.get_symbol_table().get_names()))
+        return None
+
+    def test_new_non_terminal_names(self) -> None:
+        grammar = NonContextGrammar("S -> X a\nX -> b\nY -> N1")
+        names = [grammar._get_new_non_terminal_name() for _ in range(5)]
+        self.assertEqual(["Z", "N2", "N3", "N4", "N5"], names)
+
+        symbols = grammar.get_symbol_table()
+        for _ in range(1000):
+            symbols.new_non_terminal()
+        self.assertEqual(len(set(symbols.get_names())), len(symbols))
+        self.assertEqual(0, symbols.get_id("$"))
+        return None
+
+    def test_stats(self) -> None:
+        grammar = NonContextGrammar(self.default_grammar_input0)
+        grammar.convert_grammar()
+        self.assertIsNone(grammar.get_stats())
+
+        grammar = NonContextGrammar(self.default_grammar_input0, collect_stats=True)
+        grammar.convert_grammar()
+        grammar.construct_analysis_table()
+        stats = grammar.get_stats()
+        self.assertEqual(["load_grammar", "eliminate_left_recursion", "left_factoring", "first", "follow",
+                          "analysis_table"], list(stats.get_stages()))
+        self.assertEqual(4, stats.get_stage("load_grammar").get_counter("productions_added"))
+        factoring = stats.get_stage("left_factoring")
+        self.assertEqual(1, factoring.get_counter("new_non_terminals"))
+        self.assertEqual(3, factoring.get_counter("productions_removed"))
+        self.assertGreater(stats.get_stage("first").get_counter("iterations"), 0)
+        self.assertGreater(stats.get_total("sort_calls"), 0)
+        self.assertEqual(len(grammar.get_transitions()),
+                         stats.get_total("productions_added") - stats.get_total("productions_removed"))
+
+        grammar.construct_analysis_table()
+        self.assertEqual(1, stats.get_stage("analysis_table").get_counter("calls"))
+        return None
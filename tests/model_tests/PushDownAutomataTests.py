@@ -0,0 +1,222 @@
+import os
+import tempfile
+import unittest
+
+from utils.model.Grammar import NonContextGrammar
+from utils.model.ParseError import ParseError
+from utils.model.ParseProfile import ParseProfile
+from utils.model.PushdownAutomata import PushDownAutomata
+
+
+class PushDownAutomataTests(unittest.TestCase):
+    def setUp(self) -> None:
+        grammar_input: str = "P -> K V C \n" \
+                             "K -> c K \n" \
+                             "K -> & \n" \
+                             "V -> v V \n" \
+                             "V -> F \n" \
+                             "F -> f P ; F \n" \
+                             "F -> & \n" \
+                             "C -> b V C e \n" \
+                             "C -> com ; C \n" \
+                             "C -> &"
+        self.grammar = NonContextGrammar(grammar_input)
+        self.grammar.convert_grammar()
+        self.table = self.grammar.construct_analysis_table()
+        self.automata = PushDownAutomata(self.grammar.get_initial_state(), self.table)
+        self.accepted = [
+            [],
+            ["c", "c", "v"],
+            ["c", "v", "f", ";", "b", "v", "e"],
+            ["v", "f", ";", "b", "v", "e"],
+            ["f", "c", ";", "com", ";"],
+        ]
+        self.rejected = [
+            ["v", "c"],
+            ["f"],
+            ["b", "v"],
+            ["x"],
+        ]
+
+    def test_run(self) -> None:
+        for sentence in self.accepted:
+            self.assertTrue(self.automata.run(sentence), sentence)
+        for sentence in self.rejected:
+            self.assertFalse(self.automata.run(sentence), sentence)
+        return None
+
+    def test_run_does_not_mutate_input(self) -> None:
+        sentence = ["c", "c", "v"]
+        self.assertTrue(self.automata.run(sentence))
+        self.assertEqual(["c", "c", "v"], sentence)
+        return None
+
+    def test_run_iterator(self) -> None:
+        self.assertTrue(self.automata.run(iter(["c", "v", "v"])))
+        self.assertTrue(self.automata.run(token for token in "c v v".split()))
+        self.assertFalse(self.automata.run(token for token in "v c".split()))
+        return None
+
+    def test_run_long_sentence(self) -> None:
+        sentence = ["c"] * 100000 + ["v"] * 100000
+        self.assertTrue(self.automata.run(sentence))
+        self.assertEqual(200000, len(sentence))
+        return None
+
+    def test_run_profiled(self) -> None:
+        profile = ParseProfile()
+        for sentence in self.accepted + self.rejected:
+            expected = self.automata.run(sentence)
+            self.assertEqual(expected, self.automata.run(sentence, profile), sentence)
+
+        self.assertEqual(len(self.accepted) + len(self.rejected), profile.get_sentences())
+        self.assertEqual(len(self.accepted), profile.get_accepted())
+        self.assertEqual(sum(profile.get_expansions_per_token().values()), profile.get_tokens())
+        self.assertEqual(sum(profile.get_cell_hits().values()), profile.get_expansions())
+        self.assertEqual(max(profile.get_cell_hits().values()), profile.get_hot_cells(1)[0][1])
+        self.assertEqual(len(self.rejected), len(profile.get_failures()))
+        self.assertIn((len(self.accepted) + 3, 0, "P", "x"), profile.get_failures())
+        self.assertGreater(profile.get_max_stack_depth(), 2)
+
+        profile = ParseProfile()
+        self.assertTrue(self.automata.run(["c", "c", "v"], profile))
+        self.assertEqual(3, profile.get_matches())
+        self.assertEqual(4, profile.get_tokens())
+        self.assertEqual(6, profile.get_expansions())
+        self.assertEqual(1, profile.get_cell_hits()[("K", "c")])
+        return None
+
+    def test_run_with_recovery(self) -> None:
+        follow = self.grammar.get_follow()
+        for sentence in self.accepted:
+            self.assertEqual([], self.automata.run_with_recovery(sentence, follow), sentence)
+        for sentence in self.rejected:
+            self.assertNotEqual([], self.automata.run_with_recovery(sentence, follow), sentence)
+
+        self.assertEqual([ParseError(1, "$", [";"])], self.automata.run_with_recovery(["f"], follow))
+        errors = self.automata.run_with_recovery(["v", "c", "c", "b", "x", "v", "e"], follow)
+        self.assertEqual([1, 4], [error.get_position() for error in errors])
+        self.assertEqual(["c", "x"], [error.get_token() for error in errors])
+        self.assertIn("com", errors[0].get_expected())
+        self.assertNotIn("c", errors[0].get_expected())
+
+        sentence = ["c", "x", "v"] * 10000
+        errors = self.automata.run_with_recovery(iter(sentence), follow)
+        self.assertEqual(10000, len(errors))
+        return None
+
+    def test_run_compiled(self) -> None:
+        for sentence in self.accepted + self.rejected:
+            self.assertEqual(self.automata.run(sentence), self.automata.run_compiled(sentence), sentence)
+        self.assertFalse(self.automata.run_compiled(["P"]))
+        self.assertTrue(self.automata.run_compiled(iter(["c", "v"])))
+        return None
+
+    def test_compiled_table(self) -> None:
+        compiled = self.automata.compile()
+        self.assertIs(compiled, self.automata.compile())
+        self.assertEqual(0, compiled.get_symbol_id("$"))
+        self.assertNotIn("&", compiled.get_symbols())
+        for terminal in self.grammar.get_terminals() - {"&"}:
+            self.assertLess(compiled.get_symbol_id(terminal), compiled.get_width())
+        for non_terminal in self.grammar.get_non_terminals():
+            self.assertGreaterEqual(compiled.get_symbol_id(non_terminal), compiled.get_width())
+        return None
+
+    def test_run_batch(self) -> None:
+        sentences = (self.accepted + self.rejected) * 50
+        expected = [self.automata.run(sentence) for sentence in sentences]
+        for workers in (1, 2):
+            result = self.automata.run_batch(sentences, workers=workers)
+            self.assertEqual(expected, result.get_verdicts())
+            self.assertGreater(result.get_throughput(), 0)
+        return None
+
+    def test_incremental(self) -> None:
+        for sentence in self.accepted + self.rejected:
+            parser = self.automata.incremental()
+            for i in range(0, len(sentence), 2):
+                parser.feed(sentence[i:i + 2])
+            self.assertEqual(self.automata.run(sentence), parser.finish(), sentence)
+
+        parser = self.automata.incremental()
+        self.assertTrue(parser.feed(["c", "c"]))
+        self.assertTrue(parser.feed(iter(["v"])))
+        self.assertEqual(3, parser.get_position())
+        self.assertFalse(parser.feed(["c", "v"]))
+        self.assertTrue(parser.is_rejected())
+        self.assertEqual(3, parser.get_error_position())
+        self.assertFalse(parser.feed(["v"]))
+        self.assertFalse(parser.finish())
+
+        parser = self.automata.incremental()
+        self.assertTrue(parser.feed(["c", "f"]))
+        self.assertFalse(parser.finish())
+        self.assertEqual(2, parser.get_error_position())
+        return None
+
+    def test_parse(self) -> None:
+        for sentence in self.rejected:
+            self.assertIsNone(self.automata.parse(sentence))
+
+        sentence = ["c", "v", "f", ";", "b", "v", "e"]
+        tree = self.automata.parse(sentence)
+        self.assertIsNotNone(tree)
+        self.assertEqual(list(range(len(sentence))), tree.get_token_indices())
+        nodes = list(tree.walk())
+        self.assertEqual((0, "P", -1), nodes[0])
+        leaves = [(symbol, token_index) for _, symbol, token_index in nodes if token_index >= 0]
+        self.assertEqual(list(zip(sentence, range(len(sentence)))), leaves)
+        for production_id in tree.get_production_ids():
+            head, body = tree.get_production(production_id)
+            self.assertIn(head, self.table)
+            self.assertIn(body, self.table[head].values())
+        return None
+
+    def test_compiled_table_with_grammar_symbols(self) -> None:
+        symbols = self.grammar.get_symbol_table()
+        automata = PushDownAutomata(self.grammar.get_initial_state(), self.table, symbols)
+        compiled = automata.compile()
+        for symbol in compiled.get_symbols():
+            self.assertEqual(symbols.get_id(symbol), compiled.get_symbol_id(symbol))
+        for sentence in self.accepted + self.rejected:
+            self.assertEqual(self.automata.run(sentence), automata.run_compiled(sentence), sentence)
+        return None
+
+    def test_binary_table(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.syx")
+            self.automata.save_binary(path)
+            automata = PushDownAutomata.from_binary(path)
+            self.assertEqual(self.grammar.get_initial_state(), automata._initial_state)
+            for sentence in self.accepted + self.rejected:
+                self.assertEqual(self.automata.run(sentence), automata.run_compiled(sentence), sentence)
+                self.assertEqual(self.automata.run(sentence), automata.run(sentence), sentence)
+
+            sentences = (self.accepted + self.rejected) * 20
+            result = automata.run_batch(sentences, workers=2)
+            self.assertEqual([self.automata.run(sentence) for sentence in sentences], result.get_verdicts())
+            automata._mapped.close()
+
+            with open(path, "r+b") as table_file:
+                table_file.write(b"XXXX")
+            self.assertRaises(ValueError, PushDownAutomata.from_binary, path)
+        return None
+
+    def test_generated_parser_module(self) -> None:
+        namespace = dict()
+        exec(compile(self.automata.generate_parser_module(), "generated_parser", "exec"), namespace)
+        parse = namespace["parse"]
+        for sentence in self.accepted + self.rejected:
+            self.assertEqual(self.automata.run(sentence), parse(sentence), sentence)
+        self.assertTrue(parse(iter(["c", "v"])))
+        self.assertTrue(parse(["c"] * 100000 + ["v"] * 100000))
+
+        # Aninhamento além do limite de recursão cai no laço sobre a tabela embutida.
+        nested = ["f"] * 5000 + [";"] * 5000
+        self.assertTrue(self.automata.run_compiled(nested))
+        self.assertTrue(parse(nested))
+        self.assertFalse(parse(nested[:-1]))
+        for sentence in self.accepted + self.rejected:
+            self.assertEqual(self.automata.run(sentence), namespace["_parse_with_table"](sentence + ["$"]), sentence)
+        return None
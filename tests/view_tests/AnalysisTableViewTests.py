@@ -0,0 +1,158 @@
+import unittest
+
+from utils.view.AnalysisTableView import CELL_CHARACTERS, CELL_WIDTH, ROW_HEIGHT, AnalysisTableView
+
+
+class StubCanvas:
+    # Substitui o Canvas do Tk: guarda os itens criados e simula a rolagem em pixels.
+    def __init__(self, width: int = 480, height: int = 320) -> None:
+        self.width = width
+        self.height = height
+        self.items = list()
+        self.x = 0
+        self.y = 0
+        self.scrollregion = (0, 0, 1, 1)
+
+    def config(self, scrollregion=None, **_) -> None:
+        if scrollregion is not None:
+            self.scrollregion = scrollregion
+        return None
+
+    def _scroll(self, offset: int, step: int, total: int, visible: int, *args) -> int:
+        if args[0] == "moveto":
+            offset = int(float(args[1]) * total)
+        else:
+            offset += int(args[1]) * step
+        return max(0, min(offset, max(total - visible, 0)))
+
+    def xview(self, *args):
+        if not args:
+            return self.x / self.scrollregion[2], (self.x + self.width) / self.scrollregion[2]
+        self.x = self._scroll(self.x, CELL_WIDTH, self.scrollregion[2], self.width, *args)
+        return None
+
+    def yview(self, *args):
+        if not args:
+            return self.y / self.scrollregion[3], (self.y + self.height) / self.scrollregion[3]
+        self.y = self._scroll(self.y, ROW_HEIGHT, self.scrollregion[3], self.height, *args)
+        return None
+
+    def xview_moveto(self, fraction: float) -> None:
+        self.x = int(fraction * self.scrollregion[2])
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:
+        self.y = int(fraction * self.scrollregion[3])
+        return None
+
+    def canvasx(self, x: int) -> float:
+        return self.x + x
+
+    def canvasy(self, y: int) -> float:
+        return self.y + y
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    def delete(self, _: str) -> None:
+        self.items.clear()
+        return None
+
+    def create_rectangle(self, *coordinates, **options) -> None:
+        self.items.append(("rectangle", coordinates, options))
+        return None
+
+    def create_text(self, *coordinates, **options) -> None:
+        self.items.append(("text", coordinates, options))
+        return None
+
+    def texts(self):
+        return [options["text"] for kind, _, options in self.items if kind == "text"]
+
+
+class StubVar:
+    def __init__(self, value: str = "") -> None:
+        self.value = value
+
+    def get(self) -> str:
+        return self.value
+
+
+class StubLabel:
+    def __init__(self) -> None:
+        self.text = ""
+
+    def config(self, text: str) -> None:
+        self.text = text
+        return None
+
+
+class AnalysisTableViewTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # A grade é montada sem Tk: só os atributos usados por set_table/_apply_filters/_redraw.
+        self.view = AnalysisTableView.__new__(AnalysisTableView)
+        self.view._table = {}
+        self.view._row_filter = StubVar()
+        self.view._column_filter = StubVar()
+        self.view._summary = StubLabel()
+        self.view._cells = StubCanvas()
+        self.view._row_header = StubCanvas(height=320)
+        self.view._column_header = StubCanvas(width=480)
+        self.non_terminals = [f"N{i:04d}" for i in range(5000)]
+        self.terminals = [f"t{j:04d}" for j in range(3000)] + ["&"]
+        self.table = {state: {"t0000": ("t0000", state), "$": ("&",)} for state in self.non_terminals}
+
+    def test_visible_range(self) -> None:
+        self.assertEqual(range(0, 16), self.view._visible_range(0, 320, ROW_HEIGHT, 1000))
+        self.assertEqual(range(10, 26), self.view._visible_range(10 * ROW_HEIGHT + 5, 320, ROW_HEIGHT, 1000))
+        self.assertEqual(range(995, 1000), self.view._visible_range(995 * ROW_HEIGHT, 320, ROW_HEIGHT, 1000))
+        self.assertEqual(range(0, 0), self.view._visible_range(0, 320, ROW_HEIGHT, 0))
+        return None
+
+    def test_redraw_only_visible_cells(self) -> None:
+        self.view.set_table(self.table, self.non_terminals, self.terminals)
+        self.assertEqual("5000 x 3001", self.view._summary.text)
+        self.assertEqual((0, 0, 3001 * CELL_WIDTH, 5000 * ROW_HEIGHT), self.view._cells.scrollregion)
+
+        rectangles = [item for item in self.view._cells.items if item[0] == "rectangle"]
+        self.assertEqual(16 * 6, len(rectangles))
+        self.assertEqual(["$", "t0000", "t0001"], self.view._column_header.texts()[:3])
+        self.assertEqual("N0000", self.view._row_header.texts()[0])
+        self.assertIn("&", self.view._cells.texts())
+        self.assertIn("t0000 N0000", self.view._cells.texts())
+
+        self.view._yview("scroll", 100, "units")
+        self.assertEqual("N0100", self.view._row_header.texts()[0])
+        self.assertEqual(100 * ROW_HEIGHT, self.view._row_header.y)
+        self.view._xview("scroll", 2, "units")
+        self.assertEqual("t0001", self.view._column_header.texts()[0])
+        self.assertEqual(16 * 6, len([item for item in self.view._cells.items if item[0] == "rectangle"]))
+        return None
+
+    def test_filters(self) -> None:
+        self.view.set_table(self.table, self.non_terminals, self.terminals)
+        self.view._yview("scroll", 100, "units")
+        self.view._row_filter.value = "N001"
+        self.view._column_filter.value = " t000 "
+        self.view._apply_filters()
+        self.assertEqual([f"N001{i}" for i in range(10)], self.view._rows)
+        self.assertEqual([f"t000{j}" for j in range(10)], self.view._columns)
+        self.assertEqual("10 x 10", self.view._summary.text)
+        # A rolagem volta ao início quando o filtro muda.
+        self.assertEqual("N0010", self.view._row_header.texts()[0])
+        self.assertEqual(10 * 6, len([item for item in self.view._cells.items if item[0] == "rectangle"]))
+
+        self.view.clear()
+        self.assertEqual("0 x 0", self.view._summary.text)
+        self.assertEqual([], self.view._row_header.items)
+        return None
+
+    def test_fit(self) -> None:
+        self.assertEqual("short", AnalysisTableView._fit("short"))
+        long_text = "x" * (CELL_CHARACTERS + 5)
+        self.assertEqual(CELL_CHARACTERS, len(AnalysisTableView._fit(long_text)))
+        self.assertTrue(AnalysisTableView._fit(long_text).endswith("…"))
+        return None
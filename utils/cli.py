@@ -0,0 +1,134 @@
+import argparse
+import json
+import sys
+from typing import Dict, Iterable, List, Optional, Set, TextIO
+
+from .model.Grammar import NonContextGrammar
+from .model.GrammarCache import DEFAULT_CACHE_DIRECTORY, GrammarCache
+from .model.ParseError import ParseError
+from .model.PushdownAutomata import PushDownAutomata
+
+
+# Interface de linha de comando sem Tk: nada aqui (nem nos módulos importados) pode depender de
+# tkinter ou de utils.view, para que o analisador rode em servidores e pipelines.
+# Toda saída é JSON, um objeto por linha.
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="Analisador sintático LL(1) sem interface gráfica.")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIRECTORY,
+                        help="diretório do cache de gramáticas convertidas")
+    parser.add_argument("--no-cache", action="store_true", help="converte a gramática sem usar o cache")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    table = commands.add_parser("table", help="imprime a tabela de análise, uma célula por linha")
+    table.add_argument("grammar", help="arquivo com a gramática")
+
+    check = commands.add_parser("check", help="informa se a gramática convertida é LL(1)")
+    check.add_argument("grammar", help="arquivo com a gramática")
+
+    parse = commands.add_parser("parse", help="aceita ou rejeita cada sentença (uma por linha)")
+    parse.add_argument("grammar", help="arquivo com a gramática")
+    parse.add_argument("tokens", nargs="?", default="-",
+                       help="arquivo com as sentenças; '-' ou ausente lê da entrada padrão")
+    parse.add_argument("--recover", action="store_true",
+                       help="continua após cada erro (modo pânico) e lista todos os erros da sentença")
+    return parser
+
+
+def load_grammar(path: str, cache: Optional[GrammarCache] = None) -> NonContextGrammar:
+    with open(path, encoding="utf-8") as grammar_file:
+        grammar_input: str = grammar_file.read()
+
+    if cache is not None:
+        return cache.load_or_convert(grammar_input)
+
+    grammar = NonContextGrammar(grammar_input)
+    grammar.convert_grammar()
+    return grammar
+
+
+def _write(output: TextIO, record: Dict) -> None:
+    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return None
+
+
+def _table(grammar: NonContextGrammar, output: TextIO) -> int:
+    table: Dict = grammar.construct_analysis_table()
+    for non_terminal in sorted(table):
+        for terminal, production in sorted(table[non_terminal].items()):
+            _write(output, {"non_terminal": non_terminal, "terminal": terminal, "production": list(production)})
+
+    return 0
+
+
+def _check(grammar: NonContextGrammar, output: TextIO) -> int:
+    is_ll1: bool = grammar.is_ll1()
+    _write(output, {"ll1": is_ll1,
+                    "initial_state": grammar.get_initial_state(),
+                    "non_terminals": sorted(grammar.get_non_terminals()),
+                    "terminals": sorted(grammar.get_terminals()),
+                    "conflicts": [{"non_terminal": state, "terminal": terminal,
+                                   "productions": [list(body) for body in bodies]}
+                                  for (state, terminal), bodies in grammar.get_conflicts().items()]})
+    return 0 if is_ll1 else 1
+
+
+def _parse(grammar: NonContextGrammar, sentences: Iterable[str], output: TextIO, recover: bool = False) -> int:
+    if not grammar.is_ll1():
+        _write(output, {"error": "A gramática não pôde ser convertida para LL(1)"})
+        return 2
+
+    automata = PushDownAutomata(grammar.get_initial_state(),
+                                grammar.construct_analysis_table(),
+                                grammar.get_symbol_table())
+    follow: Dict[str, Set[str]] = grammar.get_follow()
+    all_accepted: bool = True
+    for line, sentence in enumerate(sentences, start=1):
+        tokens: List[str] = sentence.split()
+        if not tokens:
+            continue
+        if recover:
+            errors: List[ParseError] = automata.run_with_recovery(tokens, follow)
+            all_accepted = all_accepted and not errors
+            _write(output, {"line": line, "accepted": not errors, "errors": [error.to_dict() for error in errors]})
+            continue
+        accepted: bool = automata.run_compiled(tokens)
+        all_accepted = all_accepted and accepted
+        _write(output, {"line": line, "accepted": accepted})
+
+    return 0 if all_accepted else 1
+
+
+def main(argv: Optional[List[str]] = None,
+         stdin: TextIO = sys.stdin,
+         stdout: TextIO = sys.stdout) -> int:
+    # Códigos de saída: 0 sucesso (LL(1) / todas aceitas), 1 gramática não LL(1) ou sentença
+    # rejeitada, 2 erro de uso, de leitura ou gramática inválida.
+    args = _build_parser().parse_args(argv)
+    cache: Optional[GrammarCache] = None if args.no_cache else GrammarCache(args.cache_dir)
+    try:
+        grammar: NonContextGrammar = load_grammar(args.grammar, cache)
+    except OSError as error:
+        _write(stdout, {"error": f"Não foi possível ler a gramática: {error}"})
+        return 2
+    except ValueError as error:
+        _write(stdout, {"error": f"Gramática inválida: {error}"})
+        return 2
+
+    if args.command == "table":
+        return _table(grammar, stdout)
+    if args.command == "check":
+        return _check(grammar, stdout)
+
+    if args.tokens == "-":
+        return _parse(grammar, stdin, stdout, args.recover)
+    try:
+        token_file: TextIO = open(args.tokens, encoding="utf-8")
+    except OSError as error:
+        _write(stdout, {"error": f"Não foi possível ler as sentenças: {error}"})
+        return 2
+
+    with token_file:
+        return _parse(grammar, token_file, stdout, args.recover)
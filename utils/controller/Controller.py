@@ -1,16 +1,32 @@
-from typing import Dict
+from typing import Dict, Iterable, Iterator, Optional
 
 from ..view.View import View
 from ..view.Form import Form
 
-from ..model.Grammar import NonContextGrammar
+from ..model.GrammarCache import GrammarCache, grammar_fingerprint
+from ..model.GrammarRegistry import CompiledGrammar, GrammarRegistry
+from ..model.Lexer import Lexer, LexerError
 from ..model.PushdownAutomata import PushDownAutomata
 
-from ..utils import table_to_str
+from .Worker import Job, Worker
+
+STAGE_MESSAGES: Dict[str, str] = {
+    "eliminate_left_recursion": "Eliminando recursão à esquerda...",
+    "left_factoring": "Fatorando...",
+    "first": "Calculando FIRST...",
+    "follow": "Calculando FOLLOW...",
+    "analysis_table": "Construindo a tabela de análise...",
+}
+# A cada quantos tokens a análise informa o progresso (e verifica se foi cancelada).
+PROGRESS_INTERVAL: int = 10000
+
 
 class Controller:
     def __init__(self) -> None:
         self._view = View()
+        self._registry = GrammarRegistry(cache=GrammarCache())
+        self._worker = Worker(self._view, on_progress=self._log)
+        self.pd_automata: Optional[PushDownAutomata] = None
         self._bind_callbacks()
 
     def run(self) -> None:
@@ -25,41 +41,97 @@ class Controller:
         idd: str = "token_input"
         token_table_input: Form = self._view.get_form_by_id(idd)
         token_table_input.add_btn_callback(btn_id=idd, callback=self._handle_add_token_input_callback)
+
+        idd: str = "job"
+        job: Form = self._view.get_form_by_id(idd)
+        job.add_btn_callback(btn_id="cancel", callback=self._handle_cancel_callback)
         return None
 
+    # Conversão e análise rodam no Worker; os métodos _on_* são chamados de volta na thread do Tk.
+
     def _handle_add_grammar_input_callback(self, response: Dict) -> None:
         try:
             grammar_input: str = response["text_entries"]["grammar_input"][0:-1]
-            self.grammar = NonContextGrammar(grammar_input)
         except:
             self._log("Algo deu errado ao adicionar a definição da gramática")
         else:
-            try:
-                self.grammar.convert_grammar()
-                if self.grammar.is_ll1():
-                    table: Dict = self.grammar.construct_analysis_table()
-                    table_repr = table_to_str(table, self.grammar.get_non_terminals(), self.grammar.get_terminals())
-                    self._view.insert_text(idd="analysis_table", text=table_repr)
-                    initial_state: str = self.grammar.get_initial_state()
-                    self.pd_automata: PushDownAutomata = PushDownAutomata(initial_state, table)
-                    self._log("Gramática Criada Com Sucesso")
-                else:
-                    self._log("Não foi possível converter para LL(1)")
-            except:
-                    self._log("Algo deu errado")
+            # O registro só é consultado e alterado aqui, na thread do Tk.
+            compiled: Optional[CompiledGrammar] = self._registry.get(grammar_fingerprint(grammar_input))
+            self._worker.submit(lambda job: self._compile_grammar(job, grammar_input, compiled),
+                                on_done=self._on_grammar_compiled,
+                                on_error=self._on_grammar_error)
+        return None
+
+    def _compile_grammar(self, job: Job, grammar_input: str, compiled: Optional[CompiledGrammar]) -> CompiledGrammar:
+        if compiled is None:
+            compiled = self._registry.compile(grammar_input,
+                                              on_stage=lambda stage: job.report(STAGE_MESSAGES[stage]),
+                                              on_checkpoint=job.check_cancelled)
+
+        return compiled
+
+    def _on_grammar_compiled(self, compiled: CompiledGrammar) -> None:
+        compiled = self._registry.add(compiled)
+        self.grammar = compiled.get_grammar()
+        if compiled.is_ll1():
+            # A grade desenha só as células visíveis direto do dicionário da tabela.
+            self._view.show_analysis_table(self.grammar.construct_analysis_table(),
+                                           self.grammar.get_non_terminals(),
+                                           self.grammar.get_terminals())
+            self.pd_automata = compiled.get_automata()
+            self.lexer = Lexer.from_grammar(self.grammar)
+            self._log("Gramática Criada Com Sucesso")
+        else:
+            self._log("Não foi possível converter para LL(1)")
+        return None
+
+    def _on_grammar_error(self, _: Exception) -> None:
+        self._log("Algo deu errado")
         return None
 
     def _handle_add_token_input_callback(self, response: Dict) -> None:
         try:
-            token_table = response["text_entries"]["token_input"].split()
+            token_input: str = response["text_entries"]["token_input"]
         except:
             self._log("Algo deu errado ao adicionar a tabela de tokens")
         else:
-            is_accepted: bool = self.pd_automata.run(token_table)
-            if is_accepted:
-                self._log("Aceito")
-            else:
-                self._log("Não aceito")
+            if self.pd_automata is None:
+                self._log("Nenhuma gramática LL(1) foi criada")
+                return None
+            # run_compiled usa uma pilha local: um job cancelado que ainda esteja terminando
+            # não interfere no próximo.
+            automata, lexer = self.pd_automata, self.lexer
+            self._worker.submit(lambda job: automata.run_compiled(self._track(job, lexer.tokenize(token_input))),
+                                on_done=self._on_sentence_parsed,
+                                on_error=self._on_sentence_error)
+        return None
+
+    @staticmethod
+    def _track(job: Job, tokens: Iterable[str]) -> Iterator[str]:
+        for position, token in enumerate(tokens):
+            if position % PROGRESS_INTERVAL == 0:
+                job.report(f"Analisando... {position} tokens")
+            yield token
+
+        return None
+
+    def _on_sentence_parsed(self, is_accepted: bool) -> None:
+        if is_accepted:
+            self._log("Aceito")
+        else:
+            self._log("Não aceito")
+        return None
+
+    def _on_sentence_error(self, error: Exception) -> None:
+        if isinstance(error, LexerError):
+            self._log(f"Token inválido na posição {error.position}")
+        else:
+            self._log("Algo deu errado")
+        return None
+
+    def _handle_cancel_callback(self, _: Dict) -> None:
+        if not self._worker.cancel():
+            self._log("Nenhuma tarefa em execução")
         return None
 
     def _log(self, message: str) -> None:
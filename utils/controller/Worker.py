@@ -0,0 +1,123 @@
+from queue import Empty, Queue
+from threading import Event, Thread
+from typing import Any, Callable, Optional, Tuple
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    # Trabalho executado fora da thread do Tk. A função recebe o próprio Job e chama report()
+    # nos pontos de verificação: a mensagem vai para a fila e, se o job foi cancelado,
+    # JobCancelled interrompe a execução ali mesmo.
+    def __init__(self, function: Callable[["Job"], Any]) -> None:
+        self._function: Callable[["Job"], Any] = function
+        self._cancelled: Event = Event()
+        self._messages: "Queue[Tuple[str, Any]]" = Queue()
+        self._thread: Thread = Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+        return None
+
+    def _run(self) -> None:
+        try:
+            result: Any = self._function(self)
+            self.check_cancelled()
+        except JobCancelled:
+            self._messages.put(("cancelled", None))
+        except Exception as error:
+            self._messages.put(("error", error))
+        else:
+            self._messages.put(("done", result))
+
+        return None
+
+    def report(self, message: str) -> None:
+        self.check_cancelled()
+        self._messages.put(("progress", message))
+        return None
+
+    def check_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise JobCancelled()
+
+        return None
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        return None
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def get_messages(self) -> "Queue[Tuple[str, Any]]":
+        return self._messages
+
+
+class Worker:
+    # Executa um job por vez em segundo plano e entrega progresso e resultado na thread do Tk,
+    # consultando a fila do job com widget.after() a cada `interval` ms (o Tk não é thread-safe).
+    # Um novo submit() cancela o job anterior, cujo resultado é descartado.
+    def __init__(self,
+                 widget: Any,
+                 on_progress: Callable[[str], None],
+                 interval: int = 50) -> None:
+        self._widget: Any = widget
+        self._on_progress: Callable[[str], None] = on_progress
+        self._interval: int = interval
+        self._job: Optional[Job] = None
+        self._on_done: Optional[Callable[[Any], None]] = None
+        self._on_error: Optional[Callable[[Exception], None]] = None
+
+    def submit(self,
+               function: Callable[[Job], Any],
+               on_done: Callable[[Any], None],
+               on_error: Callable[[Exception], None]) -> Job:
+        self.cancel()
+        job: Job = Job(function)
+        self._job, self._on_done, self._on_error = job, on_done, on_error
+        job.start()
+        self._widget.after(self._interval, self._poll, job)
+        return job
+
+    def cancel(self) -> bool:
+        if self._job is None:
+            return False
+
+        self._job.cancel()
+        self._job = None
+        self._on_progress("Cancelado")
+        return True
+
+    def is_busy(self) -> bool:
+        return self._job is not None
+
+    def _poll(self, job: Job) -> None:
+        if job is not self._job:
+            return None
+
+        progress: Optional[str] = None
+        messages = job.get_messages()
+        while True:
+            try:
+                kind, value = messages.get_nowait()
+            except Empty:
+                break
+
+            if kind == "progress":
+                progress = value
+                continue
+            self._job = None
+            if kind == "done":
+                self._on_done(value)
+            elif kind == "error":
+                self._on_error(value)
+            return None
+
+        # Só a mensagem mais recente é mostrada, para não inundar o Logger.
+        if progress is not None:
+            self._on_progress(progress)
+        self._widget.after(self._interval, self._poll, job)
+        return None
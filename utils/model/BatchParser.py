@@ -0,0 +1,89 @@
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Union
+
+from .BinaryTable import MappedTable
+from .CompiledTable import CompiledTable
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool as PoolType
+
+
+# Tabela do processo trabalhador, recebida uma única vez pelo initializer do pool.
+_worker_table: Optional[Union[CompiledTable, MappedTable]] = None
+
+
+def _init_worker(table: Union[CompiledTable, MappedTable]) -> None:
+    global _worker_table
+    _worker_table = table
+    return None
+
+
+def _run_sentence(sentence: Sequence[str]) -> bool:
+    return _worker_table.run(sentence)
+
+
+class BatchResult:
+    def __init__(self, verdicts: List[bool], elapsed: float) -> None:
+        self._verdicts: List[bool] = verdicts
+        self._elapsed: float = elapsed
+
+    def get_verdicts(self) -> List[bool]:
+        return self._verdicts
+
+    def get_elapsed(self) -> float:
+        return self._elapsed
+
+    def get_throughput(self) -> float:
+        if self._elapsed <= 0:
+            return float("inf")
+
+        return len(self._verdicts) / self._elapsed
+
+    def __repr__(self) -> str:
+        accepted: int = sum(self._verdicts)
+        return f"{len(self._verdicts)} sentences ({accepted} accepted) " \
+               f"in {self._elapsed:.3f}s ({self.get_throughput():.1f} sentences/s)"
+
+
+class BatchParser:
+    def __init__(self,
+                 table: Union[CompiledTable, MappedTable],
+                 workers: Optional[int] = None,
+                 chunksize: int = 256) -> None:
+        # workers=None usa um processo por CPU; workers=1 analisa no próprio processo.
+        self._table: Union[CompiledTable, MappedTable] = table
+        self._workers: Optional[int] = workers
+        self._chunksize: int = chunksize
+        self._pool: Optional["PoolType"] = None
+
+    def run(self, sentences: Iterable[Sequence[str]]) -> BatchResult:
+        start: float = perf_counter()
+        if self._workers == 1:
+            verdicts: List[bool] = [self._table.run(sentence) for sentence in sentences]
+        else:
+            verdicts = list(self._get_pool().imap(_run_sentence, sentences, self._chunksize))
+
+        return BatchResult(verdicts, perf_counter() - start)
+
+    def _get_pool(self) -> "PoolType":
+        if self._pool is None:
+            # Importado aqui: o multiprocessing sozinho custa dezenas de ms na importação do modelo.
+            from multiprocessing import Pool
+            self._pool = Pool(self._workers, initializer=_init_worker, initargs=(self._table,))
+
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+        return None
+
+    def __enter__(self) -> "BatchParser":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        return None
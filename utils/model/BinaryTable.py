@@ -0,0 +1,167 @@
+import mmap
+import struct
+import sys
+from itertools import chain
+from typing import Dict, Iterable, List, Tuple
+
+from .CompiledTable import END_MARKER, CompiledTable
+
+
+# Formato binário da tabela compilada (inteiros de 32 bits na ordem de bytes do cabeçalho):
+#   cabeçalho   MAGIC, versão, ordem de bytes, width, nº de símbolos, id inicial,
+#               nº de células, tamanho do pool e tamanho do bloco de nomes
+#   nomes       nº de símbolos + 1 deslocamentos seguidos dos nomes em UTF-8 (alinhado a 4 bytes)
+#   células     um deslocamento no pool por célula (id(A) * width + id(a)), -1 se vazia
+#   pool        sequências a empilhar, já invertidas: [tamanho, id, id, ...]
+MAGIC: bytes = b"SYXT"
+FORMAT_VERSION: int = 1
+HEADER: struct.Struct = struct.Struct("=4s8I")
+LITTLE_ENDIAN: int = 1
+BIG_ENDIAN: int = 2
+
+
+def _byte_order() -> int:
+    return LITTLE_ENDIAN if sys.byteorder == "little" else BIG_ENDIAN
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % 4)
+
+
+def save_binary_table(table: CompiledTable, path: str) -> None:
+    symbols: List[str] = table.get_symbols()
+    encoded_names: List[bytes] = [symbol.encode("utf-8") for symbol in symbols]
+    name_offsets: List[int] = [0]
+    for name in encoded_names:
+        name_offsets.append(name_offsets[-1] + len(name))
+    names: bytes = struct.pack(f"={len(name_offsets)}I", *name_offsets) + b"".join(encoded_names)
+    names += _padding(len(names))
+
+    pool: List[int] = list()
+    pool_offsets: Dict[Tuple[int, ...], int] = dict()
+    cells: List[int] = list()
+    for cell in table.get_cells():
+        if cell is None:
+            cells.append(-1)
+            continue
+        if cell not in pool_offsets:
+            pool_offsets[cell] = len(pool)
+            pool.append(len(cell))
+            pool.extend(cell)
+        cells.append(pool_offsets[cell])
+
+    header: bytes = HEADER.pack(MAGIC, FORMAT_VERSION, _byte_order(), table.get_width(), len(symbols),
+                                table.get_initial_state_id(), len(cells), len(pool), len(names))
+    with open(path, "wb") as table_file:
+        table_file.write(header)
+        table_file.write(names)
+        table_file.write(struct.pack(f"={len(cells)}i", *cells))
+        table_file.write(struct.pack(f"={len(pool)}i", *pool))
+
+    return None
+
+
+class MappedTable:
+    # Tabela compilada lida diretamente de um arquivo mapeado em memória: células e pool são
+    # visões (memoryview) sobre as páginas do arquivo, compartilhadas entre processos pelo
+    # cache de páginas do sistema. Só os nomes dos terminais viram um dicionário.
+    def __init__(self, path: str) -> None:
+        self._path: str = path
+        with open(path, "rb") as table_file:
+            self._map: mmap.mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, byte_order, width, symbols_count, initial_state, cells_count, pool_size, names_size = \
+            HEADER.unpack_from(self._map, 0)
+        if (magic != MAGIC) or (version != FORMAT_VERSION) or (byte_order != _byte_order()):
+            self._map.close()
+            raise ValueError(f"{path} is not a compatible binary analysis table")
+
+        view: memoryview = memoryview(self._map)
+        offset: int = HEADER.size
+        name_offsets: memoryview = view[offset:offset + 4 * (symbols_count + 1)].cast("I")
+        names_start: int = offset + 4 * (symbols_count + 1)
+        self._symbols: List[str] = [
+            bytes(view[names_start + name_offsets[i]:names_start + name_offsets[i + 1]]).decode("utf-8")
+            for i in range(symbols_count)
+        ]
+        name_offsets.release()
+        offset += names_size
+        self._cells: memoryview = view[offset:offset + 4 * cells_count].cast("i")
+        offset += 4 * cells_count
+        self._pool: memoryview = view[offset:offset + 4 * pool_size].cast("i")
+        view.release()
+
+        self._width: int = width
+        self._initial_state: int = initial_state
+        self._terminal_ids: Dict[str, int] = {self._symbols[idd]: idd for idd in range(width)}
+        # Sequências do pool já usadas, decodificadas sob demanda (só as produções quentes).
+        self._decoded: Dict[int, Tuple[int, ...]] = dict()
+
+    def get_path(self) -> str:
+        return self._path
+
+    def get_symbols(self) -> List[str]:
+        return self._symbols
+
+    def get_width(self) -> int:
+        return self._width
+
+    def get_initial_state(self) -> str:
+        return self._symbols[self._initial_state]
+
+    def run(self, sentence: Iterable[str]) -> bool:
+        cells = self._cells
+        pool = self._pool
+        width = self._width
+        decoded = self._decoded
+        lookup = self._terminal_ids.get
+        stack: List[int] = [0, self._initial_state]
+        pop = stack.pop
+        extend = stack.extend
+        for token in chain(sentence, (END_MARKER,)):
+            symbol = lookup(token)
+            if symbol is None:
+                return False
+
+            top = pop()
+            while top != symbol:
+                offset = cells[top * width + symbol]
+                if offset < 0:
+                    return False
+                push = decoded.get(offset)
+                if push is None:
+                    push = decoded[offset] = tuple(pool[offset + 1:offset + 1 + pool[offset]])
+                extend(push)
+                top = pop()
+
+            if symbol == 0:
+                return True
+
+        return False
+
+    def to_analysis_table(self) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        table: Dict[str, Dict[str, Tuple[str, ...]]] = dict()
+        for state in range(self._width, len(self._symbols)):
+            row: Dict[str, Tuple[str, ...]] = dict()
+            for terminal in range(self._width):
+                offset = self._cells[state * self._width + terminal]
+                if offset >= 0:
+                    pushes = self._pool[offset + 1:offset + 1 + self._pool[offset]]
+                    row[self._symbols[terminal]] = tuple(self._symbols[idd] for idd in reversed(pushes)) or ("&",)
+            table[self._symbols[state]] = row
+
+        return table
+
+    def close(self) -> None:
+        self._cells.release()
+        self._pool.release()
+        self._map.close()
+        return None
+
+    # Entre processos (ex.: BatchParser) só o caminho é enviado; cada processo mapeia o arquivo.
+    def __getstate__(self) -> Dict:
+        return {"path": self._path}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__(state["path"])
+        return None
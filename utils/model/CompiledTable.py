@@ -0,0 +1,143 @@
+from array import array
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .ParseTree import ParseTree
+from .SymbolTable import SymbolTable
+
+
+END_MARKER: str = "$"
+EPSILON: str = "&"
+
+
+class CompiledTable:
+    # Tabela de análise com símbolos internados como inteiros.
+    # Terminais ocupam os ids [0, width) (o "$" é sempre 0) e não terminais os ids seguintes.
+    # A célula M[A][a] fica em cells[id(A) * width + id(a)] e guarda a sequência a empilhar,
+    # já invertida e sem "&"; None indica célula vazia.
+    # Com `symbols` (a SymbolTable da gramática) os ids internados na conversão são reaproveitados,
+    # desde que o "$" seja o id 0 e todos os terminais venham antes dos não terminais.
+    def __init__(self,
+                 initial_state: str,
+                 analysis_table: Dict[str, Dict[str, Tuple[str, ...]]],
+                 symbols: Optional[SymbolTable] = None) -> None:
+        non_terminals: List[str] = sorted(analysis_table)
+        terminals: List[str] = self._collect_terminals(analysis_table)
+        if symbols is None:
+            symbols = SymbolTable(terminals + non_terminals)
+
+        self._symbols: List[str] = list(symbols.get_names())
+        self._ids: Dict[str, int] = {symbol: idd for idd, symbol in enumerate(self._symbols)}
+        self._terminal_ids: Dict[str, int] = {terminal: self._ids[terminal] for terminal in terminals}
+        self._width: int = max(self._terminal_ids.values()) + 1
+        if self._ids[END_MARKER] != 0 or any(self._ids[state] < self._width for state in non_terminals):
+            raise ValueError("The symbol table must intern '$' first and every terminal before the non-terminals")
+        self._initial_state: int = self._ids[initial_state]
+        self._cells: List[Optional[Tuple[int, ...]]] = [None] * (len(self._symbols) * self._width)
+        # Usados apenas por parse(): id da produção de cada célula (-1 se vazia).
+        self._productions: List[Tuple[str, Tuple[str, ...]]] = list()
+        self._cell_productions: array = array("l", [-1]) * len(self._cells)
+
+        production_ids: Dict[Tuple[str, Tuple[str, ...]], int] = dict()
+        for non_terminal in non_terminals:
+            offset: int = self._ids[non_terminal] * self._width
+            for terminal, production in sorted(analysis_table[non_terminal].items()):
+                transition = (non_terminal, production)
+                if transition not in production_ids:
+                    production_ids[transition] = len(self._productions)
+                    self._productions.append(transition)
+
+                self._cells[offset + self._ids[terminal]] = self._compile_production(production)
+                self._cell_productions[offset + self._ids[terminal]] = production_ids[transition]
+
+    @staticmethod
+    def _collect_terminals(analysis_table: Dict[str, Dict[str, Tuple[str, ...]]]) -> List[str]:
+        terminals = set()
+        for row in analysis_table.values():
+            terminals.update(row)
+            for production in row.values():
+                terminals.update(production)
+
+        terminals -= set(analysis_table)
+        terminals -= {END_MARKER, EPSILON}
+        return [END_MARKER] + sorted(terminals)
+
+    def _compile_production(self, production: Tuple[str, ...]) -> Tuple[int, ...]:
+        return tuple(self._ids[symbol] for symbol in reversed(production) if symbol != EPSILON)
+
+    def get_symbols(self) -> List[str]:
+        return self._symbols
+
+    def get_symbol_id(self, symbol: str) -> int:
+        return self._ids[symbol]
+
+    def get_width(self) -> int:
+        return self._width
+
+    def get_productions(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        return self._productions
+
+    def get_cells(self) -> List[Optional[Tuple[int, ...]]]:
+        return self._cells
+
+    def get_terminal_ids(self) -> Dict[str, int]:
+        return self._terminal_ids
+
+    def get_initial_state_id(self) -> int:
+        return self._initial_state
+
+    def run(self, sentence: Iterable[str]) -> bool:
+        cells = self._cells
+        width = self._width
+        lookup = self._terminal_ids.get
+        stack: List[int] = [0, self._initial_state]
+        pop = stack.pop
+        extend = stack.extend
+        for token in chain(sentence, (END_MARKER,)):
+            symbol = lookup(token)
+            if symbol is None:
+                return False
+
+            top = pop()
+            while top != symbol:
+                push = cells[top * width + symbol]
+                if push is None:
+                    return False
+                extend(push)
+                top = pop()
+
+            if symbol == 0:
+                return True
+
+        return False
+
+    def parse(self, sentence: Iterable[str]) -> Optional[ParseTree]:
+        cells = self._cells
+        cell_productions = self._cell_productions
+        width = self._width
+        lookup = self._terminal_ids.get
+        stack: List[int] = [0, self._initial_state]
+        pop = stack.pop
+        extend = stack.extend
+        nodes: array = array("l")
+        append = nodes.append
+        for index, token in enumerate(chain(sentence, (END_MARKER,))):
+            symbol = lookup(token)
+            if symbol is None:
+                return None
+
+            top = pop()
+            while top != symbol:
+                cell = top * width + symbol
+                push = cells[cell]
+                if push is None:
+                    return None
+                append(cell_productions[cell])
+                extend(push)
+                top = pop()
+
+            if symbol == 0:
+                return ParseTree(self._productions, nodes)
+            append(-index - 1)
+
+        return None
@@ -1,49 +1,198 @@
-from copy import copy
-from typing import Dict, List, Set, Tuple, cast
+from collections import deque
+from heapq import heapify, heappop, heappush
+from time import perf_counter
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
+from utils.model.GrammarStats import GrammarStats
+from utils.model.SymbolTable import SymbolTable
 from utils.utils import (
+    PRODUCTION_END,
     should_replace,
-    add_factored_transition,
+    strongly_connected_components,
     assemble_new_transition,
-    find_longest_common_prefix,
+    build_prefix_trie,
+    follow_trie_path,
     get_new_body,
+    has_common_prefix,
+    is_trie_leaf,
 )
 
 
+# Versão do algoritmo de conversão: deve ser incrementada sempre que a eliminação de recursão,
+# a fatoração, FIRST/FOLLOW ou a tabela mudarem de resultado (invalida o GrammarCache).
+CONVERSION_VERSION: int = 2
+
+# Iterações dos laços longos da conversão entre duas chamadas de on_checkpoint.
+CHECKPOINT_INTERVAL: int = 1024
+
+EPSILON_BIT: int = 1
+END_MARKER_BIT: int = 2
+
+T = TypeVar("T")
+
+
 class NonContextGrammar:
-    def __init__(self, grammar_input: str) -> None:
+    def __init__(self, grammar_input: str, collect_stats: bool = False) -> None:
+        self._init_attributes()
+        if collect_stats:
+            self.enable_stats()
+        self._run_stage("load_grammar", lambda: self._set_grammar(grammar_input))
+        for terminal in sorted(self._terminals):
+            self._get_terminal_bit(terminal)
+
+        # Terminais recebem os ids mais baixos ("$" = 0) e não terminais os seguintes, inclusive
+        # os criados na conversão; a CompiledTable pode reaproveitar esses ids diretamente.
+        single_letters = [state for state in self._non_terminals - {"S"} if len(state) == 1]
+        self._symbols: SymbolTable = SymbolTable(
+            ["$", "&"] + sorted(self._terminals - {"&"}) + sorted(self._non_terminals),
+            next_letter=chr(ord(max(single_letters, default="@")) + 1)
+        )
+
+    def _init_attributes(self) -> None:
         self._non_terminals: Set[str] = set()
         self._terminals: Set[str] = set()
         # transition = (non_terminal, sequence of symbols)
         self._transitions: Set[Tuple[str, Tuple[str, ...]]] = set()
-        self._set_grammar(grammar_input)
+        # Índices mantidos por _add_transition/_remove_transition:
+        # não terminal -> corpos das suas produções e símbolo -> ids das transições que o usam no corpo.
+        # Cada transição recebe um id inteiro para que o índice por símbolo não recalcule o hash
+        # do corpo inteiro para cada símbolo (o hash de tuplas não fica guardado).
+        self._productions_of: Dict[str, Set[Tuple[str, ...]]] = dict()
+        self._transitions_using: Dict[str, Set[int]] = dict()
+        self._transition_ids: Dict[Tuple[str, Tuple[str, ...]], int] = dict()
+        self._transitions_by_id: Dict[int, Tuple[str, Tuple[str, ...]]] = dict()
+        self._next_transition_id: int = 0
+        # Conjuntos de terminais (FIRST/FOLLOW) são guardados como bitsets em ints;
+        # o bit 0 é o "&", o bit 1 é o "$" e os demais terminais recebem bits sob demanda.
+        self._terminal_bits: Dict[str, int] = {"&": EPSILON_BIT, "$": END_MARKER_BIT}
+        self._bit_terminals: List[str] = ["&", "$"]
+        # Tabela de análise calculada por construct_analysis_table(), descartada a cada mudança,
+        # e as células disputadas por mais de uma produção encontradas na mesma passada.
+        self._analysis_table: Optional[Dict[str, Dict[str, Tuple[str, ...]]]] = None
+        self._conflicts: Dict[Tuple[str, str], List[Tuple[str, ...]]] = dict()
+        # Instrumentação opcional: desabilitada, custa um teste de None por produção alterada
+        # e as ordenações usam o sorted embutido.
+        self._stats: Optional[GrammarStats] = None
+        self._sorted: Callable[..., List] = sorted
+        # Ponto de verificação chamado durante convert_grammar()/construct_analysis_table()
+        # (por exemplo, para cancelar a conversão lançando uma exceção no meio de uma etapa).
+        self._on_checkpoint: Optional[Callable[[], None]] = None
+        self._checkpoints: int = 0
+        return None
+
+    def enable_stats(self) -> GrammarStats:
+        if self._stats is None:
+            self._stats = GrammarStats()
+            self._sorted = self._stats.sorted
+
+        return self._stats
+
+    def get_stats(self) -> Optional[GrammarStats]:
+        return self._stats
+
+    def _run_stage(self, name: str, stage: Callable[[], T]) -> T:
+        if self._stats is None:
+            return stage()
+
+        non_terminals: int = len(self._non_terminals)
+        stage_stats = self._stats.start_stage(name)
+        start: float = perf_counter()
+        try:
+            return stage()
+        finally:
+            stage_stats.add_elapsed(perf_counter() - start)
+            stage_stats.count("new_non_terminals", len(self._non_terminals) - non_terminals)
+            self._stats.finish_stage()
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        if self._stats is not None:
+            self._stats.count(counter, amount)
+
+        return None
+
+    def _checkpoint(self) -> None:
+        if self._on_checkpoint is not None:
+            self._checkpoints += 1
+            if self._checkpoints % CHECKPOINT_INTERVAL == 0:
+                self._on_checkpoint()
+
+        return None
 
-        temp_states = self._non_terminals - {"S"}
-        self._next_new_state = chr(ord(max(temp_states)) + 1)
+    def convert_grammar(self,
+                        on_stage: Optional[Callable[[str], None]] = None,
+                        on_checkpoint: Optional[Callable[[], None]] = None) -> None:
+        # on_stage(nome) é chamado antes de cada etapa (progresso) e on_checkpoint() a cada
+        # CHECKPOINT_INTERVAL iterações dentro delas; ambos podem lançar uma exceção para abortar.
+        stages: List[Tuple[str, Callable[[], None]]] = [
+            ("eliminate_left_recursion", self._eliminate_left_recursion),
+            ("left_factoring", self._left_factoring),
+            ("first", self._set_first),
+            ("follow", self._set_follow),
+        ]
+        self._on_checkpoint = on_checkpoint
+        try:
+            for name, stage in stages:
+                if on_stage is not None:
+                    on_stage(name)
+                self._run_stage(name, stage)
+        finally:
+            self._on_checkpoint = None
 
-    def convert_grammar(self) -> None:
-        self._eliminate_left_recursion()
-        self._left_factoring()
-        self._set_first()
-        self._set_follow()
         return None
 
     def _set_grammar(self, grammar_input: str) -> None:
         symbols: Set[str] = set()
-        self._initial_symbol: str = grammar_input[0]
-        for line in sorted(grammar_input.split("\n")):
+        if not grammar_input.split():
+            raise ValueError("A gramática está vazia")
+        self._initial_symbol: str = grammar_input.split()[0]
+        for line in self._sorted(grammar_input.split("\n")):
             sequence: List[str] = line.split()
+            if not sequence:
+                continue
+            if len(sequence) < 3 or sequence[1] != "->":
+                raise ValueError(f"Produção inválida: {line.strip()!r} (esperado 'A -> corpo')")
             non_terminal: str = sequence[0]
             del sequence[:2]
             self._non_terminals.add(non_terminal)
             transition = (non_terminal, tuple(sequence))
-            self._transitions.add(transition)
-            for symbol in sorted(sequence): symbols.add(symbol)
+            self._add_transition(transition)
+            for symbol in self._sorted(sequence): symbols.add(symbol)
 
         self._terminals = symbols - self._non_terminals
 
         return None
 
+    def _add_transition(self, transition: Tuple[str, Tuple[str, ...]]) -> None:
+        if transition in self._transitions:
+            return None
+
+        self._transitions.add(transition)
+        self._analysis_table = None
+        if self._stats is not None:
+            self._stats.count("productions_added")
+        self._productions_of.setdefault(transition[0], set()).add(transition[1])
+        transition_id: int = self._next_transition_id
+        self._next_transition_id += 1
+        self._transition_ids[transition] = transition_id
+        self._transitions_by_id[transition_id] = transition
+        for symbol in set(transition[1]):
+            self._transitions_using.setdefault(symbol, set()).add(transition_id)
+
+        return None
+
+    def _remove_transition(self, transition: Tuple[str, Tuple[str, ...]]) -> None:
+        self._transitions.remove(transition)
+        self._analysis_table = None
+        if self._stats is not None:
+            self._stats.count("productions_removed")
+        self._productions_of[transition[0]].discard(transition[1])
+        transition_id: int = self._transition_ids.pop(transition)
+        del self._transitions_by_id[transition_id]
+        for symbol in set(transition[1]):
+            self._transitions_using[symbol].discard(transition_id)
+
+        return None
+
     def get_initial_state(self) -> str:
         return self._initial_symbol
 
@@ -57,73 +206,112 @@ class NonContextGrammar:
         return self._transitions
 
     def get_first(self) -> Dict[str, Set[str]]:
-        return self._first
+        return {non_terminal: self._bits_to_set(bits) for non_terminal, bits in self._first.items()}
 
     def get_follow(self) -> Dict[str, Set[str]]:
-        return self._follow
+        return {non_terminal: self._bits_to_set(bits) for non_terminal, bits in self._follow.items()}
 
-    def _get_new_non_terminal_name(self) -> str:
-        if self._next_new_state != "S":
-            new_state: str = self._next_new_state
-            self._next_new_state = chr(ord(self._next_new_state) + 1)
-        else:
-            self._next_new_state = chr(ord(self._next_new_state) + 1)
-            new_state: str = self._next_new_state
-            self._next_new_state = chr(ord(self._next_new_state) + 1)
+    def _get_terminal_bit(self, terminal: str) -> int:
+        bit = self._terminal_bits.get(terminal)
+        if bit is None:
+            bit = 1 << len(self._bit_terminals)
+            self._terminal_bits[terminal] = bit
+            self._bit_terminals.append(terminal)
 
-        return new_state
+        return bit
+
+    def _bits_to_list(self, bits: int) -> List[str]:
+        terminals: List[str] = list()
+        while bits:
+            lowest_bit: int = bits & -bits
+            terminals.append(self._bit_terminals[lowest_bit.bit_length() - 1])
+            bits ^= lowest_bit
+
+        return terminals
+
+    def _bits_to_set(self, bits: int) -> Set[str]:
+        return set(self._bits_to_list(bits))
+
+    def get_symbol_table(self) -> SymbolTable:
+        return self._symbols
+
+    def _get_new_non_terminal_name(self) -> str:
+        return self._symbols.new_non_terminal()
 
     def _eliminate_left_recursion(self) -> None:
-        non_terminals: List[str] = list(sorted(self._non_terminals))
+        non_terminals: List[str] = list(self._sorted(self._non_terminals))
+        order: Dict[str, int] = {non_terminal: i for i, non_terminal in enumerate(non_terminals)}
         for i in range(len(non_terminals)):
-            for j in range(i):
-                transitions = copy(self._transitions)
-                for transition in sorted(transitions):
-                    if (non_terminals[i] == transition[0]) \
-                            and (non_terminals[j] == transition[1][0]):
-                        self._transitions.remove(transition)
-                        alpha = list(transition[1][1:])
-                        productions = self.get_all_productions_of_state(non_terminals[j])
-                        for production in sorted(productions):
-                            self._transitions.add((non_terminals[i], tuple(list(production) + alpha)))
-
+            self._checkpoint()
+            self._substitute_leading_non_terminals(non_terminals, order, i)
             self._eliminate_immediate_left_recursion(non_terminals[i])
 
         return None
 
+    def _substitute_leading_non_terminals(self, non_terminals: List[str], order: Dict[str, int], i: int) -> None:
+        # Substitui A_j -> gamma em A_i -> A_j alpha (j < i) mexendo só nas produções de A_i e A_j.
+        # Os A_j são tratados em ordem crescente, como no laço "para j < i" do algoritmo clássico:
+        # os corpos de A_i são agrupados uma vez pelo índice do não terminal inicial e um heap
+        # desses índices dá o próximo A_j, então cada corpo é visitado só quando é substituído.
+        state: str = non_terminals[i]
+        leading: Dict[int, List[Tuple[str, ...]]] = dict()
+        for body in self._productions_of.get(state, ()):
+            j: int = order.get(body[0], i)
+            if j < i:
+                leading.setdefault(j, list()).append(body)
+
+        heap: List[int] = list(leading)
+        heapify(heap)
+        while heap:
+            j = heappop(heap)
+            for body in self._sorted(leading.pop(j)):
+                self._remove_transition((state, body))
+                alpha = list(body[1:])
+                for production in self._sorted(self._productions_of.get(non_terminals[j], ())):
+                    self._checkpoint()
+                    transition = (state, tuple(list(production) + alpha))
+                    if transition in self._transitions:
+                        continue
+                    self._add_transition(transition)
+                    # As produções de A_j já começam com A_k, k > j (ou terminal): o heap só cresce para frente.
+                    k: int = order.get(transition[1][0], i)
+                    if k < i:
+                        if k not in leading:
+                            heappush(heap, k)
+                        leading.setdefault(k, list()).append(transition[1])
+
+        return None
+
     def _eliminate_immediate_left_recursion(self, state: str) -> None:
         if self.have_immediate_left_recursion(state):
             new_state = self._get_new_non_terminal_name()
             self._non_terminals.add(new_state)
             epsilon_production = (new_state, tuple("&"))
-            self._transitions.add(epsilon_production)
-            transitions = copy(self._transitions)
-            for transition in sorted(transitions):
-                if transition[0] == state:
-                    self._transitions.remove(transition)
-                    if transition[1][0] == state:
-                        new_production = (new_state, tuple(list(transition[1][1:]) + [new_state]))
-                    else:
-                        new_production = (state, tuple(list(transition[1]) + [new_state]))
+            self._add_transition(epsilon_production)
+            for body in self._sorted(self.get_all_productions_of_state(state)):
+                self._checkpoint()
+                self._remove_transition((state, body))
+                if body[0] == state:
+                    new_production = (new_state, tuple(list(body[1:]) + [new_state]))
+                else:
+                    new_production = (state, tuple(list(body) + [new_state]))
 
-                    self._transitions.add(new_production)
+                self._add_transition(new_production)
 
         return None
 
     def have_immediate_left_recursion(self, state: str) -> bool:
-        for transition in sorted(self._transitions):
-            if (transition[0] == state) and (transition[1][0] == state):
+        for body in self._productions_of.get(state, ()):
+            if body[0] == state:
                 return True
 
         return False
 
     def get_all_productions_of_state(self, state: str) -> Set[Tuple[str]]:
-        all_productions = set()
-        for transition in sorted(self._transitions):
-            if transition[0] == state:
-                all_productions.add(tuple(transition[1]))
+        return set(self._productions_of.get(state, ()))
 
-        return all_productions
+    def get_transitions_using(self, symbol: str) -> Set[Tuple[str, Tuple[str, ...]]]:
+        return {self._transitions_by_id[transition_id] for transition_id in self._transitions_using.get(symbol, ())}
 
     def _left_factoring(self) -> None:
         self._replace_indirect_with_direct_non_determinism()
@@ -131,19 +319,24 @@ class NonContextGrammar:
         return None
 
     def _replace_indirect_with_direct_non_determinism(self) -> None:
-        for non_terminal in sorted(self._non_terminals):
+        # Por não terminal: os corpos são agrupados uma vez pelo não terminal inicial, todos os grupos
+        # são substituídos numa passada e a trie de prefixos é montada e fatorada uma única vez.
+        for non_terminal in self._sorted(self._non_terminals):
+            self._checkpoint()
             productions = self.get_all_productions_of_state(non_terminal)
-            for production in sorted(productions):
+            if not should_replace(productions, self._non_terminals):
+                # Substituir apenas se houver mais de uma transição começando com não terminal
+                continue
+
+            leading: Dict[str, List[Tuple[str, ...]]] = dict()
+            for production in productions:
                 if production[0] in self._non_terminals:
-                    if should_replace(productions, self._non_terminals):
-                        # Substituir apenas se houver mais de uma transição começando com não terminal
-                        self._replace_indirect_nd_transitions(non_terminal, production[0])
-                        new_productions = self.get_all_productions_of_state(non_terminal)
-                        longest_commom_prefix = find_longest_common_prefix(sorted(list(new_productions)))
-                        if longest_commom_prefix:
-                            self._remove_direct_non_determinism()
-        return None
+                    leading.setdefault(production[0], list()).append(production)
 
+            for nt_to_replace, bodies in self._sorted(leading.items()):
+                self._replace_indirect_nd_transitions(non_terminal, nt_to_replace, bodies)
+            self._factor_non_terminal(non_terminal)
+        return None
 
     # def _replace_indirect_with_direct_non_determinism(self) -> None:
         # productions_with_same_terminals: Dict[str, Set] = self._get_productions_with_same_terminals()
@@ -165,207 +358,284 @@ class NonContextGrammar:
         # return None
 
     def _get_productions_with_same_terminals(self) -> Dict[str, Set]:
-        ways_to_get_to_terminal: Dict[str, Set] = {terminal: set() for terminal in sorted(self._terminals)}
+        ways_to_get_to_terminal: Dict[str, Set] = {terminal: set() for terminal in self._sorted(self._terminals)}
 
-        for non_terminal in sorted(self._non_terminals):
+        for non_terminal in self._sorted(self._non_terminals):
             productions = self.get_all_productions_of_state(non_terminal)
 
-            for production in sorted(productions):
-                for symbol in sorted(production):
+            for production in self._sorted(productions):
+                for symbol in self._sorted(production):
                     if symbol in self._terminals:
                         ways_to_get_to_terminal[symbol].add(non_terminal)
 
         return dict(filter(lambda item: len(item[1]) > 1, ways_to_get_to_terminal.items()))
 
-    def _replace_indirect_nd_transitions(self, non_terminal: str, nt_to_replace: str) -> None:
-        productions: List[Tuple[str]] = list(self.get_all_productions_of_state(nt_to_replace))
-        productions_to_replace: List[Tuple[str]] = list(self.get_all_productions_of_state(non_terminal))
-
-        for production in sorted(productions):
-            for production_to_replace in sorted(productions_to_replace):
-                if nt_to_replace in production_to_replace:
-                    new_body: Tuple[str, ...] = get_new_body(production, production_to_replace, nt_to_replace)
-                    new_transition: Tuple[str, Tuple[str, ...]] = (non_terminal, new_body)
-                    self._transitions.add(new_transition)
-
-                    removed_transition: Tuple[str, Tuple[str, ...]] = (non_terminal, tuple(production_to_replace))
-                    if removed_transition in self._transitions:
-                        self._transitions.remove(removed_transition)
+    def _replace_indirect_nd_transitions(self,
+                                         non_terminal: str,
+                                         nt_to_replace: str,
+                                         bodies: Optional[Iterable[Tuple[str, ...]]] = None) -> None:
+        # Troca nt_to_replace, no início dos corpos de non_terminal, por cada uma das suas produções.
+        # `bodies` evita reprocurar esses corpos quando o chamador já os agrupou.
+        if bodies is None:
+            bodies = [body for body in self._productions_of.get(non_terminal, ()) if body[0] == nt_to_replace]
+        productions: List[Tuple[str, ...]] = self._sorted(self._productions_of.get(nt_to_replace, ()))
+
+        for production_to_replace in self._sorted(bodies):
+            self._remove_transition((non_terminal, production_to_replace))
+            for production in productions:
+                self._checkpoint()
+                new_body: Tuple[str, ...] = get_new_body(production, production_to_replace, nt_to_replace)
+                self._add_transition((non_terminal, new_body))
 
         return None
 
     def _remove_direct_non_determinism(self) -> None:
-        new_transitions: Set[Tuple[str, Tuple[str, ...]]] = set()
-        new_non_terminals_to_add = set()
-
-        for non_terminal in sorted(self._non_terminals):
-            productions: List[Tuple[str]] = list(self.get_all_productions_of_state(non_terminal))
-            longest_commom_prefix: Tuple[str] = find_longest_common_prefix(productions)
+        for non_terminal in self._sorted(self._non_terminals):
+            self._checkpoint()
+            self._factor_non_terminal(non_terminal)
 
-            if longest_commom_prefix and (longest_commom_prefix != tuple("&")):
-                non_terminal_to_add = self._get_new_non_terminal_name()
-                transition_to_add = assemble_new_transition(non_terminal, longest_commom_prefix, non_terminal_to_add)
-                new_non_terminals_to_add.add(non_terminal_to_add)
-                self._transitions.add(transition_to_add)
-                self._replace_transitions(new_transitions, productions, longest_commom_prefix, non_terminal, non_terminal_to_add)
-
-        for transition in sorted(new_transitions):
-            transition = cast(Tuple[str, Tuple[str, ...]], transition)
-            self._transitions.add(transition)
-
-        for non_terminal in sorted(new_non_terminals_to_add):
-            self._non_terminals.add(non_terminal)
         return None
 
-    def _replace_transitions(self,
-                             new_transitions: Set[Tuple[str, Tuple[str, ...]]],
-                             productions: List[Tuple[str]],
-                             prefix: Tuple[str, ...],
-                             non_terminal: str,
-                             new_non_terminal: str
-                             ) -> Set[Tuple[str, Tuple[str, ...]]]:
-        for production in sorted(productions):
-            if set(prefix).issubset(production):
-                self._transitions.remove((non_terminal, production))
-                new_transitions = add_factored_transition(new_transitions, production, prefix, new_non_terminal)
-
-        return new_transitions
+    def _factor_non_terminal(self, non_terminal: str) -> None:
+        # Uma trie de prefixos por não terminal: cada bifurcação vira um novo não terminal,
+        # então todos os prefixos compartilhados são fatorados numa única passada.
+        productions: Set[Tuple[str, ...]] = self.get_all_productions_of_state(non_terminal)
+        trie: Dict[str, Dict] = build_prefix_trie(productions)
+        if not has_common_prefix(trie):
+            return None
 
-    def _set_first(self) -> None:
-        self._first: Dict[str, Set[str]] = {non_terminal: set() for non_terminal in sorted(self._non_terminals)}
-        for non_terminal in sorted(self._non_terminals):
-            self._set_first_of_non_terminal(non_terminal)
+        for production in self._sorted(productions):
+            self._remove_transition((non_terminal, production))
 
+        self._add_factored_transitions(non_terminal, trie)
         return None
 
-    def _set_first_of_non_terminal(self, non_terminal: str) -> None:
-        if self._first[non_terminal]:
-            return None
-        productions = self.get_all_productions_of_state(non_terminal)
-        for production in sorted(productions):
-            actual_symbol_of_production = production[0]
-            if actual_symbol_of_production in self._terminals:
-                self._first[non_terminal].add(actual_symbol_of_production)
-            elif actual_symbol_of_production == "&":
-                self._first[non_terminal].add("&")
+    def _add_factored_transitions(self, non_terminal: str, node: Dict[str, Dict]) -> None:
+        # Percorre a trie com uma pilha explícita (prefixos longos estourariam a recursão), na mesma
+        # ordem da versão recursiva: os novos não terminais recebem os mesmos nomes.
+        stack: List[Tuple[str, Iterator[Tuple[str, Dict]]]] = [(non_terminal, iter(self._sorted(node.items())))]
+        while stack:
+            non_terminal, children = stack[-1]
+            item: Optional[Tuple[str, Dict]] = next(children, None)
+            if item is None:
+                stack.pop()
+                continue
+
+            symbol, child = item
+            if symbol == PRODUCTION_END:
+                self._add_transition((non_terminal, tuple("&")))
+                continue
+
+            prefix, child = follow_trie_path(symbol, child)
+            if is_trie_leaf(child):
+                self._add_transition((non_terminal, prefix))
             else:
-                for i in range(len(production)):
-                    if production[i] in self._terminals:
-                        self._first[non_terminal].add(production[i])
-                        break
-
-                    first_of_symbol: Set[str] = self._get_first_of_non_terminal(production[i])
-                    self._first[non_terminal] |= first_of_symbol - {"&"}
-                    if "&" not in first_of_symbol:
-                        break
-                    elif i == len(production) - 1:
-                        self._first[non_terminal].add("&")
+                new_non_terminal: str = self._get_new_non_terminal_name()
+                self._non_terminals.add(new_non_terminal)
+                self._add_transition(assemble_new_transition(non_terminal, prefix, new_non_terminal))
+                stack.append((new_non_terminal, iter(self._sorted(child.items()))))
 
         return None
 
-    def _get_first_of_non_terminal(self, non_terminal: str) -> Set[str]:
-        if not self._first[non_terminal]:
-            self._set_first_of_non_terminal(non_terminal)
-
-        return self._first[non_terminal]
-
-    def _set_follow(self) -> None:
-        self._follow: Dict[str, Set[str]] = {non_terminal: set() for non_terminal in sorted(self._non_terminals)}
-        self._follow[self._initial_symbol].add("$")
-        for non_terminal in sorted(self._non_terminals):
-            self._set_follow_of_non_terminal(non_terminal)
-
+    def _set_first(self) -> None:
+        # FIRST(A) depende dos não terminais usados nas produções de A. Os componentes fortemente
+        # conexos desse grafo são resolvidos em ordem topológica, dependências antes, e só dentro
+        # de um componente cíclico há ponto fixo com lista de trabalho: cadeias acíclicas saem numa passada.
+        self._analysis_table = None
+        self._first: Dict[str, int] = {non_terminal: 0 for non_terminal in self._sorted(self._non_terminals)}
+        dependencies: Dict[str, Set[str]] = {non_terminal: set() for non_terminal in self._first}
+        for state, symbols in self._transitions:
+            self._checkpoint()
+            for symbol in symbols:
+                if symbol in dependencies:
+                    dependencies[state].add(symbol)
+
+        iterations: int = 0
+        for component in strongly_connected_components(self._sorted(self._non_terminals), dependencies.__getitem__):
+            members: Set[str] = set(component)
+            worklist: Deque[str] = deque(component)
+            queued: Set[str] = set(component)
+            while worklist:
+                iterations += 1
+                self._checkpoint()
+                non_terminal: str = worklist.popleft()
+                queued.discard(non_terminal)
+                first: int = 0
+                for production in self._productions_of.get(non_terminal, ()):
+                    first |= self._get_first_bits_of_production(production)
+
+                if first != self._first[non_terminal]:
+                    self._first[non_terminal] = first
+                    for transition_id in self._transitions_using.get(non_terminal, ()):
+                        state: str = self._transitions_by_id[transition_id][0]
+                        if state in members and state not in queued:
+                            queued.add(state)
+                            worklist.append(state)
+
+        self._count("iterations", iterations)
         return None
 
-    def _set_follow_of_non_terminal(self, non_terminal: str) -> None:
-        if (non_terminal != self._initial_symbol) and (self._follow[non_terminal]):
-            return None
-        productions: Set[Tuple[str, Tuple[str, ...]]] = set()
-        for production in sorted(self._transitions):
-            if non_terminal in production[1]:
-                productions.add(production)
-
-        for production in sorted(productions):
-            state: str = production[0]
-            symbols: Tuple[str, ...] = production[1]
-            for i in range(len(symbols)):
-                actual_symbol = symbols[i]
-                if actual_symbol == non_terminal:
-                    if i == len(symbols) - 1:
-                        if actual_symbol != state:
-                            self._follow[actual_symbol] |= self._get_follow_of_non_terminal(state)
-                    elif symbols[i + 1] in self._terminals:
-                        self._follow[actual_symbol].add(symbols[i + 1])
+    def _set_follow(self) -> None:
+        # Restrições de A -> alpha B beta: FIRST(beta) - {&} entra direto em FOLLOW(B) e,
+        # se beta for anulável, FOLLOW(A) flui para FOLLOW(B).
+        self._analysis_table = None
+        self._follow: Dict[str, int] = {non_terminal: 0 for non_terminal in self._sorted(self._non_terminals)}
+        self._follow[self._initial_symbol] |= END_MARKER_BIT
+        flows: Dict[str, Set[str]] = {non_terminal: set() for non_terminal in self._follow}
+        for state, symbols in self._transitions:
+            self._checkpoint()
+            rest: int = 0
+            nullable_rest: bool = True
+            for symbol in reversed(symbols):
+                if symbol == "&":
+                    continue
+                elif symbol in self._follow:
+                    self._follow[symbol] |= rest
+                    if nullable_rest and (symbol != state):
+                        flows[state].add(symbol)
+
+                    first_of_symbol: int = self._first[symbol]
+                    if first_of_symbol & EPSILON_BIT:
+                        rest |= first_of_symbol & ~EPSILON_BIT
                     else:
-                        first_of_next_symbol = self._get_first_of_non_terminal(symbols[i + 1])
-                        self._follow[actual_symbol] |= first_of_next_symbol - {"&"}
-                        count = i + 1
-                        while "&" in first_of_next_symbol and count <= len(symbols) - 2:
-                            next_symbol = symbols[count + 1]
-                            if next_symbol in self._terminals:
-                                break
-                            first_of_next_symbol = self._get_first_of_non_terminal(symbols[count + 1])
-                            self._follow[actual_symbol] |= first_of_next_symbol - {"&"}
-                            count += 1
-
-                        if "&" in first_of_next_symbol:
-                            self._follow[actual_symbol] |= self._get_follow_of_non_terminal(state)
-
+                        rest = first_of_symbol
+                        nullable_rest = False
+                else:
+                    rest = self._get_terminal_bit(symbol)
+                    nullable_rest = False
+
+        # Componentes do grafo de fluxos em ordem topológica, origens antes: ao chegar num componente
+        # tudo o que flui de fora para ele já está pronto, e só ciclos precisam de ponto fixo.
+        iterations: int = 0
+        for component in reversed(strongly_connected_components(self._sorted(self._non_terminals),
+                                                                 flows.__getitem__)):
+            members: Set[str] = set(component)
+            worklist: Deque[str] = deque(component)
+            queued: Set[str] = set(component)
+            while worklist:
+                iterations += 1
+                self._checkpoint()
+                non_terminal: str = worklist.popleft()
+                queued.discard(non_terminal)
+                follow: int = self._follow[non_terminal]
+                for target in flows[non_terminal]:
+                    if follow & ~self._follow[target]:
+                        self._follow[target] |= follow
+                        if target in members and target not in queued:
+                            queued.add(target)
+                            worklist.append(target)
+
+        self._count("iterations", iterations)
         return None
 
-    def _get_follow_of_non_terminal(self, non_terminal: str) -> Set[str]:
-        if (non_terminal == self._initial_symbol) or (not self._follow[non_terminal]):
-            self._set_follow_of_non_terminal(non_terminal)
+    def construct_analysis_table(self,
+                                 on_checkpoint: Optional[Callable[[], None]] = None) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        if self._analysis_table is not None:
+            return self._analysis_table
 
-        return self._follow[non_terminal]
+        self._on_checkpoint = on_checkpoint
+        try:
+            return self._run_stage("analysis_table", self._build_analysis_table)
+        finally:
+            self._on_checkpoint = None
 
-    def construct_analysis_table(self) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    def _build_analysis_table(self) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        # Em caso de conflito a última produção (em ordem) fica na célula, como antes,
+        # mas todas as concorrentes são guardadas em _conflicts.
         productions = list(self._transitions)
-        table = {non_terminal: {} for non_terminal in sorted(self._non_terminals)}
-        for production in sorted(productions):
+        table = {non_terminal: {} for non_terminal in self._sorted(self._non_terminals)}
+        conflicts: Dict[Tuple[str, str], Set[Tuple[str, ...]]] = dict()
+        for production in self._sorted(productions):
+            self._checkpoint()
             state = production[0]
             symbols = production[1]
-            first_of_alpha: set = self._get_first_of_production(symbols)
-            if "&" in first_of_alpha:
-                follow_of_state = self._get_follow_of_non_terminal(state)
-                for terminal in sorted(follow_of_state):
-                    table[state][terminal] = symbols
-
-                if "$" in follow_of_state:
-                    table[state]["$"] = symbols
-
-            first_of_alpha -= {"&"}
-
-            for terminal in sorted(first_of_alpha):
-                table[state][terminal] = symbols
-
+            row = table[state]
+            first_of_alpha: int = self._get_first_bits_of_production(symbols)
+            lookaheads: int = first_of_alpha & ~EPSILON_BIT
+            if first_of_alpha & EPSILON_BIT:
+                lookaheads |= self._follow[state]
+
+            for terminal in self._bits_to_list(lookaheads):
+                previous = row.get(terminal)
+                if (previous is not None) and (previous != symbols):
+                    conflicts.setdefault((state, terminal), {previous}).add(symbols)
+                row[terminal] = symbols
+
+        self._conflicts = {cell: sorted(bodies) for cell, bodies in sorted(conflicts.items())}
+        self._analysis_table = table
         return table
 
-    def _get_first_of_production(self, production: Tuple) -> Set[str]:
-        first = set()
-        size = len(production)
-        for i in range(size):
-            symbol = production[i]
-            if symbol in self._terminals:
-                first.add(symbol)
-                break
+    def get_conflicts(self) -> Dict[Tuple[str, str], List[Tuple[str, ...]]]:
+        # (não terminal, terminal) -> produções que disputam a célula
+        self.construct_analysis_table()
+        return self._conflicts
 
-            first |= self._get_first_of_non_terminal(symbol)
-            if ("&" in first) and (i < size - 1):
-                first.remove("&")
+    def _get_first_of_production(self, production: Tuple) -> Set[str]:
+        return self._bits_to_set(self._get_first_bits_of_production(production))
+
+    def _get_first_bits_of_production(self, production: Tuple) -> int:
+        first: int = 0
+        for symbol in production:
+            if symbol == "&":
+                continue
+            elif symbol in self._non_terminals:
+                first_of_symbol: int = self._first[symbol]
+                first |= first_of_symbol & ~EPSILON_BIT
+                if not first_of_symbol & EPSILON_BIT:
+                    return first
+            else:
+                return first | self._get_terminal_bit(symbol)
 
-        return first
+        return first | EPSILON_BIT
 
     def is_ll1(self) -> bool:
-        for non_terminal in sorted(self._non_terminals):
-            productions = self.get_all_productions_of_state(non_terminal)
-            if tuple("&") in productions:
-                first = self._get_first_of_non_terminal(non_terminal)
-                follow = self._get_follow_of_non_terminal(non_terminal)
-                if first.intersection(follow):
-                    return False
-
-        return True
+        return not self.get_conflicts()
+
+    def to_dict(self) -> Dict:
+        # Retrato da gramática já convertida (produções, FIRST, FOLLOW e tabela) em tipos JSON.
+        table = self.construct_analysis_table()
+        return {
+            "initial_symbol": self._initial_symbol,
+            "non_terminals": sorted(self._non_terminals),
+            "terminals": sorted(self._terminals),
+            "symbols": list(self._symbols.get_names()),
+            "transitions": [[state, list(body)] for state, body in sorted(self._transitions)],
+            "first": {state: sorted(first) for state, first in self.get_first().items()},
+            "follow": {state: sorted(follow) for state, follow in self.get_follow().items()},
+            "analysis_table": {state: {terminal: list(body) for terminal, body in row.items()}
+                               for state, row in table.items()},
+            "conflicts": [[state, terminal, [list(body) for body in bodies]]
+                          for (state, terminal), bodies in self._conflicts.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "NonContextGrammar":
+        grammar = cls.__new__(cls)
+        grammar._init_attributes()
+        grammar._initial_symbol = data["initial_symbol"]
+        grammar._non_terminals = set(data["non_terminals"])
+        grammar._terminals = set(data["terminals"])
+        grammar._symbols = SymbolTable(data["symbols"])
+        for state, body in data["transitions"]:
+            grammar._add_transition((state, tuple(body)))
+
+        for terminal in sorted(grammar._terminals):
+            grammar._get_terminal_bit(terminal)
+
+        grammar._first = {state: grammar._set_to_bits(first) for state, first in data["first"].items()}
+        grammar._follow = {state: grammar._set_to_bits(follow) for state, follow in data["follow"].items()}
+        grammar._analysis_table = {state: {terminal: tuple(body) for terminal, body in row.items()}
+                                   for state, row in data["analysis_table"].items()}
+        grammar._conflicts = {(state, terminal): [tuple(body) for body in bodies]
+                              for state, terminal, bodies in data["conflicts"]}
+        return grammar
+
+    def _set_to_bits(self, terminals: Iterable[str]) -> int:
+        bits: int = 0
+        for terminal in terminals:
+            bits |= self._get_terminal_bit(terminal)
+
+        return bits
 
     def __repr__(self) -> str:
         output: str = ""
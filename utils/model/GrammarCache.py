@@ -0,0 +1,76 @@
+import json
+import os
+from hashlib import sha256
+from typing import Callable, Dict, Optional
+
+from .Grammar import CONVERSION_VERSION, NonContextGrammar
+
+
+CACHE_FORMAT_VERSION: int = 2
+DEFAULT_CACHE_DIRECTORY: str = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "syntactic-analyzer"
+)
+
+
+def grammar_fingerprint(grammar_input: str) -> str:
+    # Forma canônica: espaços normalizados, linhas vazias descartadas e produções ordenadas
+    # (a ordem das linhas só importa para o símbolo inicial, que vem à frente).
+    lines = [" ".join(line.split()) for line in grammar_input.split("\n") if line.split()]
+    canonical: str = lines[0].split()[0] + "\n" + "\n".join(sorted(set(lines))) if lines else ""
+    return sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class GrammarCache:
+    # Cache em disco de gramáticas já convertidas, uma entrada JSON por impressão digital.
+    # As versões da conversão e do formato fazem parte da chave, então entradas antigas
+    # simplesmente deixam de ser encontradas quando o código muda.
+    def __init__(self, directory: str = DEFAULT_CACHE_DIRECTORY) -> None:
+        self._directory: str = directory
+
+    def get_path(self, grammar_input: str) -> str:
+        key: str = f"v{CACHE_FORMAT_VERSION}.{CONVERSION_VERSION}-{grammar_fingerprint(grammar_input)}"
+        return os.path.join(self._directory, key + ".json")
+
+    def load(self, grammar_input: str) -> Optional[NonContextGrammar]:
+        try:
+            with open(self.get_path(grammar_input), encoding="utf-8") as cache_file:
+                entry: Dict = json.load(cache_file)
+            if (entry["format_version"] != CACHE_FORMAT_VERSION) \
+                    or (entry["conversion_version"] != CONVERSION_VERSION):
+                return None
+            return NonContextGrammar.from_dict(entry["grammar"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Arquivo ilegível ou entrada com formato inesperado: tratada como ausente.
+            return None
+
+    def store(self, grammar_input: str, grammar: NonContextGrammar) -> None:
+        entry: Dict = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "conversion_version": CONVERSION_VERSION,
+            "grammar": grammar.to_dict(),
+        }
+        path: str = self.get_path(grammar_input)
+        temp_path: str = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(entry, cache_file)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return None
+
+    def load_or_convert(self,
+                        grammar_input: str,
+                        on_stage: Optional[Callable[[str], None]] = None,
+                        on_checkpoint: Optional[Callable[[], None]] = None) -> NonContextGrammar:
+        grammar: Optional[NonContextGrammar] = self.load(grammar_input)
+        if grammar is None:
+            grammar = NonContextGrammar(grammar_input)
+            grammar.convert_grammar(on_stage, on_checkpoint)
+            self.store(grammar_input, grammar)
+
+        return grammar
@@ -0,0 +1,166 @@
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from .Grammar import NonContextGrammar
+from .GrammarCache import GrammarCache, grammar_fingerprint
+from .PushdownAutomata import PushDownAutomata
+
+
+class CompiledGrammar:
+    # Gramática convertida junto com o autômato (e a tabela compilada) prontos para uso.
+    def __init__(self, fingerprint: str, grammar: NonContextGrammar) -> None:
+        self._fingerprint: str = fingerprint
+        self._grammar: NonContextGrammar = grammar
+        self._is_ll1: bool = grammar.is_ll1()
+        self._automata: Optional[PushDownAutomata] = None
+        if self._is_ll1:
+            self._automata = PushDownAutomata(grammar.get_initial_state(),
+                                              grammar.construct_analysis_table(),
+                                              grammar.get_symbol_table())
+            self._automata.compile()
+        self._size: int = self._estimate_size()
+
+    def _estimate_size(self) -> int:
+        size: int = sys.getsizeof(self._grammar.get_transitions())
+        for transition in self._grammar.get_transitions():
+            size += sys.getsizeof(transition) + sys.getsizeof(transition[1])
+
+        table = self._grammar.construct_analysis_table()
+        size += sys.getsizeof(table)
+        for row in table.values():
+            size += sys.getsizeof(row)
+
+        if self._automata is not None:
+            compiled = self._automata.compile()
+            size += sys.getsizeof(compiled.get_cells())
+            for cell in compiled.get_cells():
+                if cell is not None:
+                    size += sys.getsizeof(cell)
+
+        return size
+
+    def get_fingerprint(self) -> str:
+        return self._fingerprint
+
+    def get_grammar(self) -> NonContextGrammar:
+        return self._grammar
+
+    def get_automata(self) -> Optional[PushDownAutomata]:
+        return self._automata
+
+    def is_ll1(self) -> bool:
+        return self._is_ll1
+
+    def get_size(self) -> int:
+        return self._size
+
+
+class GrammarRegistry:
+    # Registro LRU, em memória, de gramáticas compiladas endereçadas por impressão digital
+    # ou por nome. Limitado em número de entradas e, opcionalmente, em bytes estimados.
+    def __init__(self,
+                 max_entries: int = 32,
+                 max_bytes: Optional[int] = None,
+                 cache: Optional[GrammarCache] = None) -> None:
+        self._max_entries: int = max_entries
+        self._max_bytes: Optional[int] = max_bytes
+        self._cache: Optional[GrammarCache] = cache
+        self._entries: "OrderedDict[str, CompiledGrammar]" = OrderedDict()
+        self._names: Dict[str, str] = dict()
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def register(self, grammar_input: str, name: Optional[str] = None) -> CompiledGrammar:
+        compiled: Optional[CompiledGrammar] = self._lookup(grammar_fingerprint(grammar_input))
+        if compiled is None:
+            compiled = self.compile(grammar_input)
+
+        return self.add(compiled, name)
+
+    def compile(self,
+                grammar_input: str,
+                on_stage: Optional[Callable[[str], None]] = None,
+                on_checkpoint: Optional[Callable[[], None]] = None) -> CompiledGrammar:
+        # Não altera o registro: pode rodar em outra thread, seguido de add() na thread dona do registro.
+        # on_stage recebe o nome de cada etapa da conversão e, por fim, "analysis_table";
+        # on_checkpoint é chamado periodicamente dentro das etapas (veja convert_grammar).
+        if self._cache is not None:
+            grammar: NonContextGrammar = self._cache.load_or_convert(grammar_input, on_stage, on_checkpoint)
+        else:
+            grammar = NonContextGrammar(grammar_input)
+            grammar.convert_grammar(on_stage, on_checkpoint)
+
+        if on_stage is not None:
+            on_stage("analysis_table")
+        grammar.construct_analysis_table(on_checkpoint)
+        return CompiledGrammar(grammar_fingerprint(grammar_input), grammar)
+
+    def add(self, compiled: CompiledGrammar, name: Optional[str] = None) -> CompiledGrammar:
+        # Se a gramática já estiver registrada, a entrada existente é mantida e devolvida.
+        fingerprint: str = compiled.get_fingerprint()
+        if fingerprint in self._entries:
+            compiled = self._entries[fingerprint]
+            self._entries.move_to_end(fingerprint)
+        else:
+            self._entries[fingerprint] = compiled
+            self._bytes += compiled.get_size()
+
+        if name is not None:
+            self._names[name] = fingerprint
+
+        self._evict()
+        return compiled
+
+    def get(self, key: str) -> Optional[CompiledGrammar]:
+        return self._lookup(self._names.get(key, key))
+
+    def _lookup(self, fingerprint: str) -> Optional[CompiledGrammar]:
+        compiled: Optional[CompiledGrammar] = self._entries.get(fingerprint)
+        if compiled is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(fingerprint)
+        return compiled
+
+    def remove(self, key: str) -> None:
+        fingerprint: str = self._names.get(key, key)
+        if fingerprint in self._entries:
+            self._discard(fingerprint)
+
+        return None
+
+    def _evict(self) -> None:
+        while len(self._entries) > 1 and ((len(self._entries) > self._max_entries)
+                                          or (self._max_bytes is not None and self._bytes > self._max_bytes)):
+            self._discard(next(iter(self._entries)))
+            self._evictions += 1
+
+        return None
+
+    def _discard(self, fingerprint: str) -> None:
+        compiled: CompiledGrammar = self._entries.pop(fingerprint)
+        self._bytes -= compiled.get_size()
+        for name in [name for name, target in self._names.items() if target == fingerprint]:
+            del self._names[name]
+
+        return None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def __contains__(self, key: str) -> bool:
+        return self._names.get(key, key) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
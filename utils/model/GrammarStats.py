@@ -0,0 +1,88 @@
+from typing import Dict, Iterable, List, Optional
+
+
+# Contadores registrados por etapa da conversão.
+COUNTERS: List[str] = ["calls", "productions_added", "productions_removed",
+                       "new_non_terminals", "iterations", "sort_calls"]
+
+
+class StageStats:
+    # Tempo de parede e contadores acumulados de uma etapa (somados se ela rodar mais de uma vez).
+    def __init__(self, name: str) -> None:
+        self._name: str = name
+        self._elapsed: float = 0.0
+        self._counters: Dict[str, int] = {counter: 0 for counter in COUNTERS}
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_elapsed(self) -> float:
+        return self._elapsed
+
+    def add_elapsed(self, elapsed: float) -> None:
+        self._elapsed += elapsed
+        return None
+
+    def get_counter(self, counter: str) -> int:
+        return self._counters[counter]
+
+    def get_counters(self) -> Dict[str, int]:
+        return dict(self._counters)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        self._counters[counter] += amount
+        return None
+
+    def to_dict(self) -> Dict:
+        return {"elapsed": self._elapsed, **self._counters}
+
+    def __repr__(self) -> str:
+        counters: str = " ".join(f"{counter}={value}" for counter, value in self._counters.items())
+        return f"{self._name}: {self._elapsed:.6f}s {counters}"
+
+
+class GrammarStats:
+    # Estatísticas por etapa de uma NonContextGrammar, coletadas só quando habilitadas
+    # (NonContextGrammar(..., collect_stats=True) ou enable_stats()).
+    def __init__(self) -> None:
+        self._stages: Dict[str, StageStats] = dict()
+        self._current: Optional[StageStats] = None
+
+    def start_stage(self, name: str) -> StageStats:
+        stage: StageStats = self._stages.setdefault(name, StageStats(name))
+        stage.count("calls")
+        self._current = stage
+        return stage
+
+    def finish_stage(self) -> None:
+        self._current = None
+        return None
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        # Contagens fora de uma etapa (chamadas diretas a métodos internos) são descartadas.
+        if self._current is not None:
+            self._current.count(counter, amount)
+
+        return None
+
+    def sorted(self, iterable: Iterable, **kwargs) -> List:
+        self.count("sort_calls")
+        return sorted(iterable, **kwargs)
+
+    def get_stage(self, name: str) -> Optional[StageStats]:
+        return self._stages.get(name)
+
+    def get_stages(self) -> Dict[str, StageStats]:
+        return self._stages
+
+    def get_total_elapsed(self) -> float:
+        return sum(stage.get_elapsed() for stage in self._stages.values())
+
+    def get_total(self, counter: str) -> int:
+        return sum(stage.get_counter(counter) for stage in self._stages.values())
+
+    def to_dict(self) -> Dict:
+        return {name: stage.to_dict() for name, stage in self._stages.items()}
+
+    def __repr__(self) -> str:
+        return "\n".join(repr(stage) for stage in self._stages.values())
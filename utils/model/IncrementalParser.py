@@ -0,0 +1,84 @@
+from typing import Iterable, List, Optional
+
+from .CompiledTable import CompiledTable
+
+
+class IncrementalParser:
+    # Analisador resumível: a pilha é mantida entre chamadas de feed(), então os tokens
+    # podem chegar em pedaços arbitrários sem que a entrada inteira fique em memória.
+    def __init__(self, table: CompiledTable) -> None:
+        self._table: CompiledTable = table
+        self._stack: List[int] = [0, table.get_initial_state_id()]
+        self._position: int = 0
+        self._error_position: Optional[int] = None
+        self._finished: bool = False
+        self._accepted: bool = False
+
+    def feed(self, tokens: Iterable[str]) -> bool:
+        if self._finished or (self._error_position is not None):
+            return False
+
+        cells = self._table.get_cells()
+        width = self._table.get_width()
+        lookup = self._table.get_terminal_ids().get
+        stack = self._stack
+        pop = stack.pop
+        extend = stack.extend
+        position = self._position
+        for token in tokens:
+            symbol = lookup(token)
+            # "$" é reservado para finish(); como token de entrada ele é rejeitado.
+            if not symbol:
+                return self._reject(position)
+
+            top = pop()
+            while top != symbol:
+                push = cells[top * width + symbol]
+                if push is None:
+                    stack.append(top)
+                    return self._reject(position)
+                extend(push)
+                top = pop()
+
+            position += 1
+
+        self._position = position
+        return True
+
+    def finish(self) -> bool:
+        if self._finished:
+            return self._accepted
+
+        self._finished = True
+        if self._error_position is not None:
+            return False
+
+        cells = self._table.get_cells()
+        width = self._table.get_width()
+        stack = self._stack
+        top = stack.pop()
+        while top != 0:
+            push = cells[top * width]
+            if push is None:
+                stack.append(top)
+                self._error_position = self._position
+                return False
+            stack.extend(push)
+            top = stack.pop()
+
+        self._accepted = True
+        return True
+
+    def _reject(self, position: int) -> bool:
+        self._position = position
+        self._error_position = position
+        return False
+
+    def is_rejected(self) -> bool:
+        return self._error_position is not None
+
+    def get_position(self) -> int:
+        return self._position
+
+    def get_error_position(self) -> Optional[int]:
+        return self._error_position
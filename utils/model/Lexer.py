@@ -0,0 +1,95 @@
+import re
+from typing import AnyStr, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
+
+from .Grammar import NonContextGrammar
+
+
+# (terminal, lexema, posição do primeiro caractere/byte na entrada)
+Token = Tuple[str, AnyStr, int]
+
+DEFAULT_IGNORE: str = r"\s+"
+
+
+class LexerError(ValueError):
+    def __init__(self, position: int, text: Union[str, bytes]) -> None:
+        super().__init__(f"Unexpected input at position {position}: {text[position:position + 20]!r}")
+        self.position: int = position
+
+
+class Lexer:
+    # Analisador léxico com um único regex combinado: classes de token (nome -> regex, na ordem dada)
+    # vêm antes dos terminais literais da gramática, ordenados do mais longo para o mais curto.
+    # Um lexema de classe igual a um terminal literal vira esse terminal (palavras reservadas).
+    # Os terminais "&" e "$" e os nomes das classes não são tratados como literais.
+    def __init__(self,
+                 terminals: Iterable[str],
+                 token_classes: Optional[Dict[str, str]] = None,
+                 ignore: str = DEFAULT_IGNORE) -> None:
+        self._token_classes: Dict[str, str] = dict(token_classes or {})
+        self._literals: List[str] = sorted(set(terminals) - {"&", "$"} - set(self._token_classes),
+                                           key=lambda terminal: (-len(terminal), terminal))
+        self._keywords: Dict[str, str] = {literal: literal for literal in self._literals}
+        self._byte_keywords: Dict[bytes, str] = {literal.encode("utf-8"): literal for literal in self._literals}
+
+        # Grupo "_i" -> terminal; None marca o grupo de texto ignorado.
+        self._group_terminals: Dict[str, Optional[str]] = {"_0": None}
+        patterns: List[str] = [f"(?P<_0>{ignore})"]
+        for name, regex in self._token_classes.items():
+            group: str = f"_{len(patterns)}"
+            self._group_terminals[group] = name
+            patterns.append(f"(?P<{group}>{regex})")
+        for literal in self._literals:
+            group = f"_{len(patterns)}"
+            self._group_terminals[group] = literal
+            patterns.append(f"(?P<{group}>{re.escape(literal)})")
+
+        self._source: str = "|".join(patterns)
+        self._pattern: Pattern[str] = re.compile(self._source)
+        self._bytes_pattern: Optional[Pattern[bytes]] = None
+
+    @classmethod
+    def from_grammar(cls, grammar: NonContextGrammar, token_classes: Optional[Dict[str, str]] = None,
+                     ignore: str = DEFAULT_IGNORE) -> "Lexer":
+        return cls(grammar.get_terminals(), token_classes, ignore)
+
+    def _get_pattern(self, text: Union[str, bytes]) -> Pattern:
+        if isinstance(text, str):
+            return self._pattern
+
+        if self._bytes_pattern is None:
+            self._bytes_pattern = re.compile(self._source.encode("utf-8"))
+
+        return self._bytes_pattern
+
+    def scan(self, text: AnyStr) -> Iterator[Token]:
+        # Gerador: os tokens são produzidos sob demanda, sem montar uma lista intermediária.
+        match = self._get_pattern(text).match
+        group_terminals = self._group_terminals
+        keywords = self._keywords.get if isinstance(text, str) else self._byte_keywords.get
+        position: int = 0
+        end: int = len(text)
+        while position < end:
+            matched = match(text, position)
+            if matched is None or matched.end() == position:
+                raise LexerError(position, text)
+
+            terminal: Optional[str] = group_terminals[matched.lastgroup]
+            lexeme = matched.group()
+            if terminal is not None:
+                yield keywords(lexeme, terminal), lexeme, position
+            position = matched.end()
+
+        return None
+
+    def tokenize(self, text: AnyStr) -> Iterator[str]:
+        # Só os terminais, no formato esperado por PushDownAutomata.run e demais analisadores.
+        for terminal, _, _ in self.scan(text):
+            yield terminal
+
+        return None
+
+    def get_literals(self) -> List[str]:
+        return self._literals
+
+    def get_token_classes(self) -> Dict[str, str]:
+        return self._token_classes
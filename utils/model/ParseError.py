@@ -0,0 +1,33 @@
+from typing import Dict, List
+
+
+class ParseError:
+    # Erro sintático encontrado na análise com recuperação: posição do token (len(sentença) para o "$"),
+    # o token encontrado e os terminais que seriam aceitos naquele ponto.
+    __slots__ = ("_position", "_token", "_expected")
+
+    def __init__(self, position: int, token: str, expected: List[str]) -> None:
+        self._position: int = position
+        self._token: str = token
+        self._expected: List[str] = expected
+
+    def get_position(self) -> int:
+        return self._position
+
+    def get_token(self) -> str:
+        return self._token
+
+    def get_expected(self) -> List[str]:
+        return self._expected
+
+    def to_dict(self) -> Dict:
+        return {"position": self._position, "token": self._token, "expected": self._expected}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParseError):
+            return NotImplemented
+
+        return (self._position, self._token, self._expected) == (other._position, other._token, other._expected)
+
+    def __repr__(self) -> str:
+        return f"ParseError({self._position}, {self._token!r}, expected={self._expected})"
@@ -0,0 +1,99 @@
+from collections import Counter
+from typing import Dict, List, Tuple
+
+
+# (número da sentença, posição do token, topo da pilha, token); a posição len(sentença) é o "$" final.
+ParseFailure = Tuple[int, int, str, str]
+
+
+class ParseProfile:
+    # Perfil acumulado por PushDownAutomata.run(sentence, profile) ao longo de um corpus:
+    # uso de cada célula (não terminal, terminal) da tabela, maior profundidade da pilha,
+    # expansões e casamentos por token e onde cada sentença rejeitada falhou.
+    # Cada lookahead conta como um token, inclusive o "$" que encerra a sentença.
+    def __init__(self) -> None:
+        self._sentences: int = 0
+        self._accepted: int = 0
+        self._tokens: int = 0
+        self._matches: int = 0
+        self._expansions: int = 0
+        self._max_stack_depth: int = 0
+        self._cell_hits: Counter = Counter()
+        self._expansions_per_token: Counter = Counter()
+        self._failures: List[ParseFailure] = list()
+
+    def record_sentence(self,
+                        accepted: bool,
+                        tokens: int,
+                        matches: int,
+                        max_stack_depth: int,
+                        expansions_per_token: Counter) -> int:
+        sentence: int = self._sentences
+        self._sentences += 1
+        self._accepted += accepted
+        self._tokens += tokens
+        self._matches += matches
+        self._max_stack_depth = max(self._max_stack_depth, max_stack_depth)
+        self._expansions_per_token.update(expansions_per_token)
+        self._expansions += sum(count * expansions for expansions, count in expansions_per_token.items())
+        return sentence
+
+    def record_failure(self, position: int, top: str, token: str) -> None:
+        # Chamado antes de record_sentence, então a sentença corrente é a de número self._sentences.
+        self._failures.append((self._sentences, position, top, token))
+        return None
+
+    def get_cell_hits(self) -> Counter:
+        # Mutável de propósito: o laço do autômato incrementa as células diretamente.
+        return self._cell_hits
+
+    def get_hot_cells(self, n: int = 10) -> List[Tuple[Tuple[str, str], int]]:
+        return self._cell_hits.most_common(n)
+
+    def get_sentences(self) -> int:
+        return self._sentences
+
+    def get_accepted(self) -> int:
+        return self._accepted
+
+    def get_tokens(self) -> int:
+        return self._tokens
+
+    def get_matches(self) -> int:
+        return self._matches
+
+    def get_expansions(self) -> int:
+        return self._expansions
+
+    def get_expansions_per_token(self) -> Counter:
+        # número de expansões antes do casamento -> quantos tokens precisaram desse número
+        return self._expansions_per_token
+
+    def get_max_stack_depth(self) -> int:
+        return self._max_stack_depth
+
+    def get_failures(self) -> List[ParseFailure]:
+        return self._failures
+
+    def get_failure_cells(self) -> Counter:
+        return Counter((top, token) for _, _, top, token in self._failures)
+
+    def to_dict(self) -> Dict:
+        return {
+            "sentences": self._sentences,
+            "accepted": self._accepted,
+            "tokens": self._tokens,
+            "matches": self._matches,
+            "expansions": self._expansions,
+            "max_stack_depth": self._max_stack_depth,
+            "cell_hits": [[state, terminal, hits] for (state, terminal), hits in self._cell_hits.most_common()],
+            "expansions_per_token": {str(expansions): count
+                                     for expansions, count in sorted(self._expansions_per_token.items())},
+            "failures": [list(failure) for failure in self._failures],
+        }
+
+    def __repr__(self) -> str:
+        ratio: float = self._expansions / self._tokens if self._tokens else 0.0
+        return f"{self._sentences} sentences ({self._accepted} accepted), {self._tokens} tokens, " \
+               f"{self._expansions} expansions ({ratio:.2f}/token), {self._matches} matches, " \
+               f"max stack depth {self._max_stack_depth}, {len(self._failures)} failures"
@@ -0,0 +1,56 @@
+from array import array
+from typing import Iterator, List, Tuple
+
+
+class ParseTree:
+    # Árvore de derivação compacta, guardada em pré-ordem numa única coluna de inteiros:
+    # um valor p >= 0 é um nó interno expandido pela produção p e um valor negativo -(i + 1)
+    # é a folha que casou o i-ésimo token da entrada. A quantidade de filhos de cada nó
+    # interno é o tamanho do corpo da produção, então a estrutura não precisa de ponteiros.
+    __slots__ = ("_productions", "_nodes")
+
+    def __init__(self, productions: List[Tuple[str, Tuple[str, ...]]], nodes: array) -> None:
+        self._productions: List[Tuple[str, Tuple[str, ...]]] = productions
+        self._nodes: array = nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get_nodes(self) -> array:
+        return self._nodes
+
+    def get_production(self, production_id: int) -> Tuple[str, Tuple[str, ...]]:
+        return self._productions[production_id]
+
+    def get_production_ids(self) -> List[int]:
+        return [node for node in self._nodes if node >= 0]
+
+    def get_token_indices(self) -> List[int]:
+        return [-node - 1 for node in self._nodes if node < 0]
+
+    def walk(self) -> Iterator[Tuple[int, str, int]]:
+        # Percorre em pré-ordem produzindo (profundidade, símbolo, índice do token);
+        # o índice é -1 para não terminais.
+        pending: List[List[str]] = []
+        for node in self._nodes:
+            depth: int = len(pending)
+            symbol: str = pending[-1].pop() if pending else ""
+            if node >= 0:
+                head, body = self._productions[node]
+                yield depth, head, -1
+                pending.append([element for element in reversed(body) if element != "&"])
+            else:
+                yield depth, symbol, -node - 1
+
+            while pending and not pending[-1]:
+                pending.pop()
+
+        return None
+
+    def __repr__(self) -> str:
+        output: str = ""
+        for depth, symbol, token_index in self.walk():
+            output += "  " * depth + symbol
+            output += f" [{token_index}]\n" if token_index >= 0 else "\n"
+
+        return output
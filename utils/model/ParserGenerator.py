@@ -0,0 +1,133 @@
+from typing import Dict, List, Set, Tuple
+
+
+HEADER: str = '''# Analisador LL(1) gerado por utils.model.ParserGenerator a partir da tabela de análise.
+# Não edite: gere novamente a partir da gramática. O módulo não depende do pacote utils.
+#
+# Uma função por não terminal, escolhendo a produção pelo lookahead. Cada função recebe a
+# lista de tokens (terminada por "$") e a posição atual e devolve a nova posição, ou -1 se
+# a entrada for rejeitada. Recursão à direita sobre o próprio não terminal vira laço.
+#
+# As demais recursões usam a pilha do Python: se o aninhamento da entrada passar do limite de
+# recursão (sys.getrecursionlimit()), parse() refaz a análise com o laço sobre a tabela embutida
+# em _TABLE, que não tem limite de profundidade.
+'''
+
+FALLBACK: str = '''
+
+def _parse_with_table(tokens):
+    stack = ["$", _INITIAL]
+    position = 0
+    while True:
+        top = stack.pop()
+        lookahead = tokens[position]
+        row = _TABLE.get(top)
+        if row is not None:
+            symbols = row.get(lookahead)
+            if symbols is None:
+                return False
+            stack.extend(symbols)
+        elif top != lookahead:
+            return False
+        elif top == "$":
+            return True
+        else:
+            position += 1
+'''
+
+
+def generate_parser_module(initial_state: str, analysis_table: Dict[str, Dict[str, Tuple[str, ...]]]) -> str:
+    non_terminals: List[str] = sorted(analysis_table)
+    function_names: Dict[str, str] = {state: f"_parse_{i}" for i, state in enumerate(non_terminals)}
+    lines: List[str] = [HEADER.rstrip("\n")]
+
+    for state in non_terminals:
+        lines.extend(_generate_function(state, analysis_table[state], function_names))
+
+    lines.append("")
+    lines.append("")
+    lines.append(f"_INITIAL = {initial_state!r}")
+    lines.extend(_generate_table(analysis_table))
+    lines.append(FALLBACK.rstrip("\n"))
+    lines.append("")
+    lines.append("")
+    lines.append("def parse(tokens):")
+    lines.append("    tokens = list(tokens)")
+    lines.append("    tokens.append(\"$\")")
+    lines.append("    try:")
+    lines.append(f"        position = {function_names[initial_state]}(tokens, 0)")
+    lines.append("    except RecursionError:")
+    lines.append("        return _parse_with_table(tokens)")
+    lines.append("    return position == len(tokens) - 1")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _generate_table(analysis_table: Dict[str, Dict[str, Tuple[str, ...]]]) -> List[str]:
+    # Corpos já invertidos e sem "&", prontos para empilhar.
+    lines: List[str] = ["_TABLE = {"]
+    for state in sorted(analysis_table):
+        row: Dict[str, Tuple[str, ...]] = analysis_table[state]
+        cells: str = ", ".join(f"{terminal!r}: {tuple(symbol for symbol in reversed(row[terminal]) if symbol != '&')!r}"
+                               for terminal in sorted(row))
+        lines.append(f"    {state!r}: {{{cells}}},")
+    lines.append("}")
+    return lines
+
+
+def _generate_function(state: str,
+                       row: Dict[str, Tuple[str, ...]],
+                       function_names: Dict[str, str]) -> List[str]:
+    lookaheads: Dict[Tuple[str, ...], Set[str]] = dict()
+    for terminal, production in row.items():
+        lookaheads.setdefault(production, set()).add(terminal)
+
+    lines: List[str] = ["", "", f"def {function_names[state]}(tokens, position):  # {state}", "    while True:",
+                        "        lookahead = tokens[position]"]
+    keyword: str = "if"
+    for production, terminals in sorted(lookaheads.items(), key=lambda item: (-len(item[1]), item[0])):
+        if len(terminals) == 1:
+            condition: str = f"lookahead == {next(iter(terminals))!r}"
+        else:
+            # Literal de conjunto num teste "in" vira uma constante frozenset no bytecode.
+            condition = "lookahead in {" + ", ".join(repr(terminal) for terminal in sorted(terminals)) + "}"
+
+        lines.append(f"        {keyword} {condition}:")
+        lines.append(f"            # {state} -> {' '.join(production)}")
+        lines.extend(_generate_body(state, production, terminals, function_names))
+        keyword = "elif"
+
+    lines.append("        return -1")
+    return lines
+
+
+def _generate_body(state: str,
+                   production: Tuple[str, ...],
+                   terminals: Set[str],
+                   function_names: Dict[str, str]) -> List[str]:
+    symbols: List[str] = [symbol for symbol in production if symbol != "&"]
+    lines: List[str] = list()
+    for i, symbol in enumerate(symbols):
+        if symbol in function_names:
+            if (i == len(symbols) - 1) and (symbol == state):
+                lines.append("            continue")
+                return lines
+            lines.append(f"            position = {function_names[symbol]}(tokens, position)")
+            lines.append("            if position < 0:")
+            lines.append("                return -1")
+        elif (i == 0) and (terminals == {symbol}):
+            lines.append("            position += 1")
+        else:
+            lines.append(f"            if tokens[position] != {symbol!r}:")
+            lines.append("                return -1")
+            lines.append("            position += 1")
+
+    lines.append("            return position")
+    return lines
+
+
+def write_parser_module(path: str, initial_state: str, analysis_table: Dict[str, Dict[str, Tuple[str, ...]]]) -> None:
+    with open(path, "w", encoding="utf-8") as module_file:
+        module_file.write(generate_parser_module(initial_state, analysis_table))
+
+    return None
@@ -1,42 +1,206 @@
-from typing import Set, Tuple, List, Dict
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .BatchParser import BatchParser, BatchResult
+from .BinaryTable import MappedTable, save_binary_table
+from .CompiledTable import CompiledTable
+from .IncrementalParser import IncrementalParser
+from .ParseError import ParseError
+from .ParseProfile import ParseProfile
+from .ParseTree import ParseTree
+from .ParserGenerator import generate_parser_module
+from .SymbolTable import SymbolTable
 
 
 class PushDownAutomata:
     def __init__(self,
                  initial_state: str,
-                 analysis_table: Dict[str, Dict[str, Tuple[str, ...]]]) -> None:
-        self._states: Set[str] = set(analysis_table.keys())
+                 analysis_table: Optional[Dict[str, Dict[str, Tuple[str, ...]]]],
+                 symbols: Optional[SymbolTable] = None,
+                 mapped: Optional[MappedTable] = None) -> None:
+        # Sem analysis_table (autômato aberto com from_binary) o dicionário só é montado,
+        # a partir da tabela mapeada, quando algum método que precisa dele for chamado.
         self._initial_state: str = initial_state
         self._stack: List[str] = list()
-        self._analysis_table: Dict[str, Dict[str, Tuple[str, ...]]] = analysis_table
+        self._symbols: Optional[SymbolTable] = symbols
+        self._compiled: Optional[CompiledTable] = None
+        self._mapped: Optional[MappedTable] = mapped
+        self._analysis_table: Optional[Dict[str, Dict[str, Tuple[str, ...]]]] = None
+        if analysis_table is not None:
+            self._set_analysis_table(analysis_table)
+
+    @classmethod
+    def from_binary(cls, path: str) -> "PushDownAutomata":
+        mapped: MappedTable = MappedTable(path)
+        return cls(mapped.get_initial_state(), None, mapped=mapped)
+
+    def save_binary(self, path: str) -> None:
+        save_binary_table(self.compile(), path)
+        return None
+
+    def _set_analysis_table(self, analysis_table: Dict[str, Dict[str, Tuple[str, ...]]]) -> None:
+        self._states: Set[str] = set(analysis_table.keys())
+        self._analysis_table = analysis_table
+        return None
+
+    def get_analysis_table(self) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        if self._analysis_table is None:
+            self._set_analysis_table(self._mapped.to_analysis_table())
+
+        return self._analysis_table
+
+    def compile(self) -> CompiledTable:
+        if self._compiled is None:
+            self._compiled = CompiledTable(self._initial_state, self.get_analysis_table(), self._symbols)
 
-    def run(self, sentence: List[str]) -> bool:
+        return self._compiled
+
+    def run(self, sentence: Iterable[str], profile: Optional[ParseProfile] = None) -> bool:
+        # A sentença é consumida de forma preguiçosa: aceita listas, geradores ou
+        # arquivos e nunca modifica a entrada do chamador.
+        # Com `profile` a análise segue por _run_profiled; o laço abaixo não muda.
+        if profile is not None:
+            return self._run_profiled(sentence, profile)
+
+        self.get_analysis_table()
         self._stack = ["$", self._initial_state]
-        sentence.append("$")
-        while sentence:
-            symbol = sentence[0]
-            top = self.top_of_stack()
-            if (top == "$" == symbol):
-                del sentence[0]
-                return True
-            elif top == symbol:
-                self._stack.pop()
-                del sentence[0]
-            elif top in self._states:
-                try:
-                    production = self._analysis_table[top][symbol]
+        for symbol in chain(sentence, ("$",)):
+            while True:
+                top = self.top_of_stack()
+                if (top == "$" == symbol):
+                    return True
+                elif top == symbol:
+                    self._stack.pop()
+                    break
+                elif top in self._states:
+                    try:
+                        production = self._analysis_table[top][symbol]
+                    except KeyError:
+                        return False
+
                     self._stack.pop()
                     for element in reversed(production):
                         if element == "&":
                             break
                         self._stack.append(element)
+                else:
+                    return False
+
+        return False
 
-                except KeyError:
+    def _run_profiled(self, sentence: Iterable[str], profile: ParseProfile) -> bool:
+        # Mesmo algoritmo de run(), anotando no perfil cada célula usada, a profundidade da pilha,
+        # as expansões de cada token e o ponto da falha.
+        analysis_table = self.get_analysis_table()
+        cell_hits: Counter = profile.get_cell_hits()
+        expansions_per_token: Counter = Counter()
+        stack: List[str] = ["$", self._initial_state]
+        self._stack = stack
+        max_stack_depth: int = len(stack)
+        matches: int = 0
+        for position, symbol in enumerate(chain(sentence, ("$",))):
+            expansions: int = 0
+            while True:
+                top = stack[-1]
+                if top == symbol:
+                    break
+                production = analysis_table.get(top, {}).get(symbol)
+                if production is None:
+                    profile.record_failure(position, top, symbol)
+                    expansions_per_token[expansions] += 1
+                    profile.record_sentence(False, position + 1, matches, max_stack_depth, expansions_per_token)
                     return False
-            else:
-                return False
+
+                cell_hits[(top, symbol)] += 1
+                expansions += 1
+                stack.pop()
+                for element in reversed(production):
+                    if element == "&":
+                        break
+                    stack.append(element)
+                max_stack_depth = max(max_stack_depth, len(stack))
+
+            expansions_per_token[expansions] += 1
+            if symbol == "$":
+                profile.record_sentence(True, position + 1, matches, max_stack_depth, expansions_per_token)
+                return True
+            stack.pop()
+            matches += 1
 
         return False
 
+    def run_with_recovery(self, sentence: Iterable[str], follow: Dict[str, Set[str]]) -> List[ParseError]:
+        # Modo pânico: numa célula vazia M[A][a], A é desempilhado se a estiver em FOLLOW(A)
+        # (conjunto de sincronização, normalmente NonContextGrammar.get_follow()); senão o token é
+        # descartado. Um terminal que não casa é desempilhado, como se tivesse sido inserido.
+        # Cada passo consome um token ou desempilha um símbolo, então a análise é linear e
+        # informa todos os erros de uma vez; a lista vazia indica sentença aceita.
+        analysis_table = self.get_analysis_table()
+        errors: List[ParseError] = list()
+        stack: List[str] = ["$", self._initial_state]
+        self._stack = stack
+        # Um erro é registrado por trecho inválido: enquanto nada casar, os descartes seguintes
+        # fazem parte da mesma recuperação.
+        recovering: bool = False
+        tokens = chain(sentence, ("$",))
+        position: int = 0
+        symbol: str = next(tokens)
+        while True:
+            top = stack[-1]
+            if top == symbol:
+                if symbol == "$":
+                    return errors
+                stack.pop()
+                recovering = False
+                position += 1
+                symbol = next(tokens)
+                continue
+
+            production = analysis_table.get(top, {}).get(symbol)
+            if production is not None:
+                stack.pop()
+                for element in reversed(production):
+                    if element == "&":
+                        break
+                    stack.append(element)
+                continue
+
+            if not recovering:
+                expected: List[str] = sorted(analysis_table[top]) if top in analysis_table else [top]
+                errors.append(ParseError(position, symbol, expected))
+                recovering = True
+
+            if top in analysis_table:
+                synchronize: bool = (symbol in follow.get(top, ())) or (symbol == "$")
+            else:
+                # Terminal (ou "$") no topo: desempilha o terminal esperado, mas nunca o "$".
+                synchronize = top != "$"
+
+            if synchronize:
+                stack.pop()
+            else:
+                position += 1
+                symbol = next(tokens)
+
+    def run_compiled(self, sentence: Iterable[str]) -> bool:
+        if self._mapped is not None:
+            return self._mapped.run(sentence)
+
+        return self.compile().run(sentence)
+
+    def parse(self, sentence: Iterable[str]) -> Optional[ParseTree]:
+        return self.compile().parse(sentence)
+
+    def incremental(self) -> IncrementalParser:
+        return IncrementalParser(self.compile())
+
+    def run_batch(self, sentences: Iterable[Sequence[str]], workers: Optional[int] = None) -> BatchResult:
+        with BatchParser(self._mapped or self.compile(), workers) as batch_parser:
+            return batch_parser.run(sentences)
+
+    def generate_parser_module(self) -> str:
+        return generate_parser_module(self._initial_state, self.get_analysis_table())
+
     def top_of_stack(self) -> str:
         return self._stack[-1]
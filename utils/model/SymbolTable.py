@@ -0,0 +1,55 @@
+from typing import Dict, Iterable, List
+
+
+class SymbolTable:
+    # Interna símbolos como ids inteiros consecutivos, na ordem de inserção, e gera nomes
+    # novos para não terminais sem colidir com nenhum símbolo já internado.
+    # Os nomes novos seguem as letras maiúsculas a partir de `next_letter` (pulando "S", que
+    # costuma ser o símbolo inicial) e, esgotado o alfabeto, passam a N1, N2, N3...
+    def __init__(self, symbols: Iterable[str] = (), next_letter: str = "A") -> None:
+        self._ids: Dict[str, int] = dict()
+        self._names: List[str] = list()
+        self._next_letter: str = next_letter
+        self._next_index: int = 1
+        for symbol in symbols:
+            self.intern(symbol)
+
+    def intern(self, symbol: str) -> int:
+        idd = self._ids.get(symbol)
+        if idd is None:
+            idd = len(self._names)
+            self._ids[symbol] = idd
+            self._names.append(symbol)
+
+        return idd
+
+    def get_id(self, symbol: str) -> int:
+        return self._ids[symbol]
+
+    def get_name(self, idd: int) -> str:
+        return self._names[idd]
+
+    def get_names(self) -> List[str]:
+        return self._names
+
+    def new_non_terminal(self) -> str:
+        while "A" <= self._next_letter <= "Z":
+            letter: str = self._next_letter
+            self._next_letter = chr(ord(letter) + 1)
+            if letter != "S" and letter not in self._ids:
+                self.intern(letter)
+                return letter
+
+        while f"N{self._next_index}" in self._ids:
+            self._next_index += 1
+
+        name: str = f"N{self._next_index}"
+        self._next_index += 1
+        self.intern(name)
+        return name
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
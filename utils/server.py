@@ -0,0 +1,250 @@
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .model.GrammarCache import GrammarCache, grammar_fingerprint
+from .model.GrammarRegistry import CompiledGrammar, GrammarRegistry
+from .model.Lexer import Lexer, LexerError
+
+
+# Serviço local de análise: cada linha recebida é um pedido JSON e cada resposta é uma linha JSON
+# com o mesmo "id" do pedido. Como a CLI, não depende de tkinter nem de utils.view.
+#
+#   {"op": "register", "grammar": "E -> ...", "name": "expr", "token_classes": {"id": "[a-z]+"}}
+#   {"op": "parse", "grammar": "expr", "tokens": ["id", "+", "id"]}
+#   {"op": "parse", "grammar": "expr", "text": "a + b", "recover": true}
+#   {"op": "stats"}
+#
+# Respostas têm "ok": true ou "ok": false com "error". As gramáticas compiladas ficam no
+# GrammarRegistry entre conexões; conversões e análises rodam em threads para não travar o laço.
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 7531
+# Limite de uma linha do protocolo (gramáticas e sentenças grandes cabem numa só linha).
+LINE_LIMIT: int = 64 * 1024 * 1024
+
+
+class RequestError(Exception):
+    pass
+
+
+class ParseServer:
+    def __init__(self, registry: Optional[GrammarRegistry] = None, workers: Optional[int] = None) -> None:
+        self._registry: GrammarRegistry = registry if registry is not None else GrammarRegistry()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(workers)
+        self._lexers: Dict[str, Lexer] = dict()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: int = 0
+
+    async def start_tcp(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        self._server = await asyncio.start_server(self._handle_client, host, port, limit=LINE_LIMIT)
+        return self._server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        self._server = await asyncio.start_unix_server(self._handle_client, path, limit=LINE_LIMIT)
+        return self._server
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+        return None
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        self._executor.shutdown(wait=False)
+        return None
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients += 1
+        try:
+            while True:
+                line: bytes = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response: Dict = await self._respond(line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._clients -= 1
+            writer.close()
+
+        return None
+
+    async def _respond(self, line: bytes) -> Dict:
+        request_id: Any = None
+        try:
+            request: Dict = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError("The request must be a JSON object")
+            request_id = request.get("id")
+            handler = {"register": self._register, "parse": self._parse, "stats": self._stats}.get(request.get("op"))
+            if handler is None:
+                raise RequestError(f"Unknown operation: {request.get('op')!r}")
+            response: Dict = await handler(request)
+        except (RequestError, LexerError, json.JSONDecodeError) as error:
+            response = {"ok": False, "error": str(error)}
+        except Exception as error:
+            response = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+
+        response["id"] = request_id
+        return response
+
+    async def _register(self, request: Dict) -> Dict:
+        grammar_input: Any = request.get("grammar")
+        if not isinstance(grammar_input, str) or not grammar_input.split():
+            raise RequestError("'grammar' must be a non-empty string")
+
+        # A conversão roda numa thread; o registro só é alterado aqui, na thread do laço.
+        compiled: Optional[CompiledGrammar] = self._registry.get(grammar_fingerprint(grammar_input))
+        if compiled is None:
+            loop = asyncio.get_running_loop()
+            compiled = await loop.run_in_executor(self._executor, self._registry.compile, grammar_input)
+        compiled = self._registry.add(compiled, request.get("name"))
+
+        fingerprint: str = compiled.get_fingerprint()
+        self._lexers = {key: lexer for key, lexer in self._lexers.items() if key in self._registry}
+        if request.get("token_classes") is not None or fingerprint not in self._lexers:
+            self._lexers[fingerprint] = Lexer.from_grammar(compiled.get_grammar(), request.get("token_classes"))
+
+        grammar = compiled.get_grammar()
+        return {"ok": True,
+                "fingerprint": fingerprint,
+                "ll1": compiled.is_ll1(),
+                "conflicts": [[state, terminal, [list(body) for body in bodies]]
+                              for (state, terminal), bodies in grammar.get_conflicts().items()]}
+
+    async def _parse(self, request: Dict) -> Dict:
+        key: Any = request.get("grammar")
+        compiled: Optional[CompiledGrammar] = self._registry.get(key) if isinstance(key, str) else None
+        if compiled is None:
+            raise RequestError(f"Unknown grammar: {key!r}")
+        if not compiled.is_ll1():
+            raise RequestError("The grammar could not be converted to LL(1)")
+
+        if "tokens" in request:
+            tokens: Any = request["tokens"]
+            if not isinstance(tokens, list) or not all(isinstance(token, str) for token in tokens):
+                raise RequestError("'tokens' must be a list of strings")
+        elif isinstance(request.get("text"), str):
+            lexer: Lexer = self._lexers.get(compiled.get_fingerprint()) or Lexer.from_grammar(compiled.get_grammar())
+            tokens = lexer.tokenize(request["text"])
+        else:
+            raise RequestError("A parse request needs 'tokens' or 'text'")
+
+        automata = compiled.get_automata()
+        loop = asyncio.get_running_loop()
+        if request.get("recover"):
+            follow = compiled.get_grammar().get_follow()
+            errors = await loop.run_in_executor(self._executor, automata.run_with_recovery, tokens, follow)
+            return {"ok": True, "accepted": not errors, "errors": [error.to_dict() for error in errors]}
+
+        accepted: bool = await loop.run_in_executor(self._executor, automata.run_compiled, tokens)
+        return {"ok": True, "accepted": accepted}
+
+    async def _stats(self, _: Dict) -> Dict:
+        return {"ok": True, "clients": self._clients, **self._registry.get_stats()}
+
+
+class ParseClient:
+    # Cliente local do ParseServer: um pedido por vez por conexão.
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader: asyncio.StreamReader = reader
+        self._writer: asyncio.StreamWriter = writer
+        self._next_id: int = 0
+
+    @classmethod
+    async def connect_tcp(cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> "ParseClient":
+        reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+        return cls(reader, writer)
+
+    @classmethod
+    async def connect_unix(cls, path: str) -> "ParseClient":
+        reader, writer = await asyncio.open_unix_connection(path, limit=LINE_LIMIT)
+        return cls(reader, writer)
+
+    async def request(self, message: Dict) -> Dict:
+        self._next_id += 1
+        message = dict(message, id=self._next_id)
+        self._writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        await self._writer.drain()
+        line: bytes = await self._reader.readline()
+        if not line:
+            raise ConnectionError("The server closed the connection")
+
+        return json.loads(line)
+
+    async def register(self, grammar_input: str, name: Optional[str] = None,
+                       token_classes: Optional[Dict[str, str]] = None) -> Dict:
+        return await self.request({"op": "register", "grammar": grammar_input, "name": name,
+                                   "token_classes": token_classes})
+
+    async def parse(self, grammar: str, tokens: Optional[List[str]] = None, text: Optional[str] = None,
+                    recover: bool = False) -> Dict:
+        message: Dict = {"op": "parse", "grammar": grammar, "recover": recover}
+        if tokens is not None:
+            message["tokens"] = tokens
+        else:
+            message["text"] = text
+
+        return await self.request(message)
+
+    async def stats(self) -> Dict:
+        return await self.request({"op": "stats"})
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+        return None
+
+    async def __aenter__(self) -> "ParseClient":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+        return None
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    cache: Optional[GrammarCache] = None if args.no_cache else GrammarCache()
+    server = ParseServer(GrammarRegistry(max_entries=args.max_grammars, cache=cache), args.workers)
+    if args.unix:
+        await server.start_unix(args.unix)
+        print(f"Listening on {args.unix}", flush=True)
+    else:
+        await server.start_tcp(args.host, args.port)
+        print(f"Listening on {args.host}:{args.port}", flush=True)
+
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="server.py", description="Serviço local de análise sintática LL(1).")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", metavar="PATH", help="escuta num socket Unix em vez de TCP")
+    parser.add_argument("--workers", type=int, default=None, help="threads para conversão e análise")
+    parser.add_argument("--max-grammars", type=int, default=32, help="gramáticas mantidas em memória")
+    parser.add_argument("--no-cache", action="store_true", help="não usa o cache de gramáticas em disco")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+    return 0
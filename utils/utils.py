@@ -1,52 +1,92 @@
-from typing import Tuple, Set, List, Dict
+from typing import Callable, Dict, Iterable, List, Set, Tuple, TypeVar
 import os
 
 
-def find_longest_common_prefix(productions: List[Tuple]) -> Tuple[str]:
-    prefix: Tuple = tuple()
-    maxsize: int = 0
-
-    for i in range(len(productions) - 1):
-        for j in range(i + 1, len(productions)):
-            t = common_prefix_size(productions[i], productions[j])
-            maxsize = max(maxsize, t)
-            if maxsize == t:
-                prefix = productions[i][:maxsize]
-
-    return prefix
-
-
-def common_prefix_size(prefix1: Tuple[str, ...], prefix2: Tuple[str, ...]) -> int:
-    size: int = 0
-    i: int = 0
-    while i < min(len(prefix1), len(prefix2)):
-        if prefix1[i] == prefix2[i]:
-            size += 1
-            i += 1
-        else:
-            break
-
-    return size
-
-
-def add_factored_transition(new_transitions: Set[Tuple[str, Tuple[str, ...]]],
-                            production: Tuple[str, ...],
-                            prefix: Tuple[str, ...],
-                            new_non_terminal: str
-                        ) -> Set[Tuple[str, Tuple[str, ...]]]:
-    new_transition: List = list()
-    prefix_size: int = len(prefix)
-    new_production: Tuple[str, ...] = production[prefix_size:] if len(production[prefix_size:]) > 1 \
-                                                                else tuple(production[prefix_size:])
-    if not(new_production):
-        new_production = tuple("&")
-
-    new_transition.append(new_non_terminal)
-    new_transition.append(new_production)
-    new_transition_tuple: Tuple = tuple(new_transition)
-    new_transitions.add(new_transition_tuple)
-
-    return new_transitions
+T = TypeVar("T")
+
+
+def strongly_connected_components(nodes: Iterable[T], successors: Callable[[T], Iterable[T]]) -> List[List[T]]:
+    # Tarjan iterativo (cadeias longas estourariam a recursão). Os componentes saem em ordem
+    # topológica reversa: cada um aparece depois de todos os componentes que ele alcança.
+    index: Dict[T, int] = dict()
+    lowlink: Dict[T, int] = dict()
+    stack: List[T] = list()
+    on_stack: Set[T] = set()
+    components: List[List[T]] = list()
+    for root in nodes:
+        if root in index:
+            continue
+
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+        while work:
+            node, pending = work[-1]
+            for successor in pending:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(successors(successor))))
+                    break
+                elif successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent: T = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: List[T] = list()
+                    while True:
+                        member: T = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+# Chave que marca, num nó da trie de prefixos, o fim de uma produção.
+PRODUCTION_END: str = ""
+
+
+def build_prefix_trie(productions: Iterable[Tuple[str, ...]]) -> Dict[str, Dict]:
+    root: Dict[str, Dict] = dict()
+    for production in productions:
+        node = root
+        for symbol in production:
+            if symbol != "&":
+                node = node.setdefault(symbol, dict())
+        node[PRODUCTION_END] = dict()
+
+    return root
+
+
+def follow_trie_path(symbol: str, node: Dict[str, Dict]) -> Tuple[Tuple[str, ...], Dict[str, Dict]]:
+    # Segue a cadeia sem ramificações a partir de `symbol`, devolvendo o prefixo comum
+    # e o nó onde ela termina (uma folha ou uma bifurcação).
+    path: List[str] = [symbol]
+    while len(node) == 1 and PRODUCTION_END not in node:
+        symbol, node = next(iter(node.items()))
+        path.append(symbol)
+
+    return tuple(path), node
+
+
+def is_trie_leaf(node: Dict[str, Dict]) -> bool:
+    return len(node) == 1 and PRODUCTION_END in node
+
+
+def has_common_prefix(trie: Dict[str, Dict]) -> bool:
+    for symbol, node in trie.items():
+        if symbol != PRODUCTION_END and not is_trie_leaf(follow_trie_path(symbol, node)[1]):
+            return True
+
+    return False
 
 
 def get_new_body(production: Tuple[str, ...],
@@ -129,13 +169,6 @@ def check_str(string: str) -> str:
     return output
 
 
-def tuple_to_str(production: tuple) -> str:
-    output = ""
-    for symbol in production:
-        output += str(symbol)
-
-    return output
-
 def should_replace(productions, non_terminals) -> bool:
     sum_ = 0
     for production in sorted(productions):
@@ -146,19 +179,3 @@ def should_replace(productions, non_terminals) -> bool:
         return True
     else:
         return False
-
-def table_to_str(table: Dict[str, Dict[str, Tuple[str, ...]]],
-                 non_terminals: Set[str],
-                 terminals: Set[str]) -> str:
-    terminals -= {"&"}
-    terminals.add("$")
-    output: str = ""
-    for non_terminal in sorted(non_terminals):
-        for terminal in sorted(terminals):
-            try:
-                production: str = tuple_to_str(table[non_terminal][terminal])
-                output += f"M[{non_terminal}][{terminal}] = {production} \n"
-            except KeyError:
-                pass
-
-    return output
@@ -0,0 +1,165 @@
+from tkinter import Canvas, Scrollbar, StringVar, Tk, Toplevel, ttk
+from typing import Dict, Iterable, List, Tuple, Union
+
+CELL_WIDTH: int = 110
+ROW_HEADER_WIDTH: int = 80
+ROW_HEIGHT: int = 22
+HEADER_FONT: Tuple[str, int, str] = ("TkDefaultFont", 9, "bold")
+# Caracteres que cabem numa célula; textos maiores são cortados com reticências.
+CELL_CHARACTERS: int = 15
+
+
+class AnalysisTableView(ttk.LabelFrame):
+    # Grade da tabela de análise desenhada num Canvas: só as células visíveis viram itens do Canvas,
+    # redesenhadas a cada rolagem ou redimensionamento, então o custo não depende do tamanho da tabela.
+    # Os dados vêm direto do dicionário da tabela; os filtros mantêm só os não terminais e os
+    # terminais cujo nome contém o texto digitado.
+    def __init__(self,
+                 parent: Union[Tk, Toplevel, ttk.LabelFrame],
+                 label: str = "",
+                 row: int = 0,
+                 column: int = 0,
+                 width: int = 480,
+                 height: int = 320) -> None:
+        super().__init__(master=parent, text=label, borderwidth=2, relief="groove", padding=5)
+        self.grid(row=row, column=column, sticky="nwse")
+        self._table: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        self._all_rows: List[str] = []
+        self._all_columns: List[str] = []
+        self._rows: List[str] = []
+        self._columns: List[str] = []
+        self._create_filters()
+        self._create_grid(width, height)
+
+    def _create_filters(self) -> None:
+        filters = ttk.Frame(master=self)
+        filters.grid(row=0, column=0, columnspan=3, sticky="we")
+        self._row_filter: StringVar = StringVar()
+        self._column_filter: StringVar = StringVar()
+        ttk.Label(master=filters, text="Non-terminal:").grid(row=0, column=0)
+        ttk.Entry(master=filters, textvariable=self._row_filter, width=10).grid(row=0, column=1)
+        ttk.Label(master=filters, text="Terminal:").grid(row=0, column=2)
+        ttk.Entry(master=filters, textvariable=self._column_filter, width=10).grid(row=0, column=3)
+        self._summary: ttk.Label = ttk.Label(master=filters, text="")
+        self._summary.grid(row=0, column=4, padx=5)
+        self._row_filter.trace_add("write", lambda *_: self._apply_filters())
+        self._column_filter.trace_add("write", lambda *_: self._apply_filters())
+        return None
+
+    def _create_grid(self, width: int, height: int) -> None:
+        background: str = "#ffffff"
+        self._corner: Canvas = Canvas(master=self, width=ROW_HEADER_WIDTH, height=ROW_HEIGHT,
+                                      bg=background, highlightthickness=0)
+        self._column_header: Canvas = Canvas(master=self, width=width, height=ROW_HEIGHT,
+                                             bg=background, highlightthickness=0)
+        self._row_header: Canvas = Canvas(master=self, width=ROW_HEADER_WIDTH, height=height,
+                                          bg=background, highlightthickness=0)
+        self._cells: Canvas = Canvas(master=self, width=width, height=height, bg=background, highlightthickness=0)
+        self._corner.grid(row=1, column=0)
+        self._column_header.grid(row=1, column=1, sticky="we")
+        self._row_header.grid(row=2, column=0, sticky="ns")
+        self._cells.grid(row=2, column=1, sticky="nwse")
+
+        y_scrollbar = Scrollbar(master=self, orient="vertical", command=self._yview)
+        x_scrollbar = Scrollbar(master=self, orient="horizontal", command=self._xview)
+        y_scrollbar.grid(row=2, column=2, sticky="ns")
+        x_scrollbar.grid(row=3, column=1, sticky="we")
+        self._cells.config(xscrollcommand=x_scrollbar.set, yscrollcommand=y_scrollbar.set,
+                           xscrollincrement=CELL_WIDTH, yscrollincrement=ROW_HEIGHT)
+        self.columnconfigure(1, weight=1)
+        self.rowconfigure(2, weight=1)
+
+        self._cells.bind("<Configure>", lambda _: self._redraw())
+        for canvas in (self._cells, self._row_header, self._column_header):
+            canvas.bind("<MouseWheel>", lambda event: self._yview("scroll", -1 if event.delta > 0 else 1, "units"))
+            canvas.bind("<Shift-MouseWheel>",
+                        lambda event: self._xview("scroll", -1 if event.delta > 0 else 1, "units"))
+            canvas.bind("<Button-4>", lambda _: self._yview("scroll", -1, "units"))
+            canvas.bind("<Button-5>", lambda _: self._yview("scroll", 1, "units"))
+        return None
+
+    def set_table(self,
+                  table: Dict[str, Dict[str, Tuple[str, ...]]],
+                  non_terminals: Iterable[str],
+                  terminals: Iterable[str]) -> None:
+        self._table = table
+        self._all_rows = sorted(non_terminals)
+        self._all_columns = sorted((set(terminals) - {"&"}) | {"$"})
+        self._apply_filters()
+        return None
+
+    def clear(self) -> None:
+        self.set_table({}, [], [])
+        return None
+
+    def _apply_filters(self) -> None:
+        row_filter: str = self._row_filter.get().strip()
+        column_filter: str = self._column_filter.get().strip()
+        self._rows = [state for state in self._all_rows if row_filter in state]
+        self._columns = [terminal for terminal in self._all_columns if column_filter in terminal]
+        self._summary.config(text=f"{len(self._rows)} x {len(self._columns)}")
+
+        width: int = max(len(self._columns) * CELL_WIDTH, 1)
+        height: int = max(len(self._rows) * ROW_HEIGHT, 1)
+        self._cells.config(scrollregion=(0, 0, width, height))
+        self._column_header.config(scrollregion=(0, 0, width, ROW_HEIGHT))
+        self._row_header.config(scrollregion=(0, 0, ROW_HEADER_WIDTH, height))
+        self._xview("moveto", 0)
+        self._yview("moveto", 0)
+        return None
+
+    def _xview(self, *args) -> None:
+        self._cells.xview(*args)
+        self._column_header.xview_moveto(self._cells.xview()[0])
+        self._redraw()
+        return None
+
+    def _yview(self, *args) -> None:
+        self._cells.yview(*args)
+        self._row_header.yview_moveto(self._cells.yview()[0])
+        self._redraw()
+        return None
+
+    def _visible_range(self, start: float, size: int, step: int, count: int) -> range:
+        first: int = max(int(start // step), 0)
+        return range(first, min(first + size // step + 2, count))
+
+    @staticmethod
+    def _fit(text: str) -> str:
+        if len(text) <= CELL_CHARACTERS:
+            return text
+
+        return text[:CELL_CHARACTERS - 1] + "…"
+
+    def _redraw(self) -> None:
+        # Apaga e redesenha apenas as linhas e colunas que cabem na área visível.
+        for canvas in (self._cells, self._row_header, self._column_header):
+            canvas.delete("all")
+
+        left: float = self._cells.canvasx(0)
+        top: float = self._cells.canvasy(0)
+        rows: range = self._visible_range(top, self._cells.winfo_height(), ROW_HEIGHT, len(self._rows))
+        columns: range = self._visible_range(left, self._cells.winfo_width(), CELL_WIDTH, len(self._columns))
+
+        for j in columns:
+            x: int = j * CELL_WIDTH
+            self._column_header.create_rectangle(x, 0, x + CELL_WIDTH, ROW_HEIGHT, outline="#cccccc", fill="#eeeeee")
+            self._column_header.create_text(x + CELL_WIDTH // 2, ROW_HEIGHT // 2, text=self._fit(self._columns[j]),
+                                            font=HEADER_FONT)
+
+        for i in rows:
+            y: int = i * ROW_HEIGHT
+            state: str = self._rows[i]
+            self._row_header.create_rectangle(0, y, ROW_HEADER_WIDTH, y + ROW_HEIGHT, outline="#cccccc", fill="#eeeeee")
+            self._row_header.create_text(ROW_HEADER_WIDTH // 2, y + ROW_HEIGHT // 2, text=self._fit(state),
+                                         font=HEADER_FONT)
+            row: Dict[str, Tuple[str, ...]] = self._table.get(state, {})
+            for j in columns:
+                x = j * CELL_WIDTH
+                self._cells.create_rectangle(x, y, x + CELL_WIDTH, y + ROW_HEIGHT, outline="#cccccc")
+                production = row.get(self._columns[j])
+                if production is not None:
+                    self._cells.create_text(x + 4, y + ROW_HEIGHT // 2, anchor="w",
+                                            text=self._fit(" ".join(production)))
+
+        return None
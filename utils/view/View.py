@@ -1,6 +1,7 @@
-from tkinter import Tk, DISABLED
-from typing import Dict
+from tkinter import Tk
+from typing import Dict, Iterable, Tuple
 
+from .AnalysisTableView import AnalysisTableView
 from .Container import Container
 from .Form import Form
 from .Logger import Logger
@@ -26,6 +27,7 @@ class View(Tk):
 
         logs: Container = Container(parent=self, label="Logger", row=1, column=1)
         self._logger = Logger(logs)
+        self._create_job_form(logs)
         return None
 
 
@@ -46,13 +48,17 @@ class View(Tk):
         self._forms[idd] = new_form
         return None
 
-    def _create_analysis_table(self, parent: Container) -> None:
-        idd: str = "analysis_table"
-        new_form: Form = Form(parent=parent, label="Analysis Table", row=1)
-        new_form.add_text_entry(idd=idd, state=DISABLED, width=60)
+    def _create_job_form(self, parent: Container) -> None:
+        idd: str = "job"
+        new_form: Form = Form(parent=parent, label="Job", row=3)
+        new_form.add_button(idd="cancel", label="Cancel")
         self._forms[idd] = new_form
         return None
 
+    def _create_analysis_table(self, parent: Container) -> None:
+        self._analysis_table = AnalysisTableView(parent=parent, label="Analysis Table", row=1)
+        return None
+
     def _create_grammar_input_form(self, parent: Container) -> None:
         idd: str = "grammar_input"
         new_form: Form = Form(parent=parent, label="Grammar Input", row=1)
@@ -69,6 +75,13 @@ class View(Tk):
         self._forms[idd].clear_text(idd)
         return None
 
+    def show_analysis_table(self,
+                            table: Dict[str, Dict[str, Tuple[str, ...]]],
+                            non_terminals: Iterable[str],
+                            terminals: Iterable[str]) -> None:
+        self._analysis_table.set_table(table, non_terminals, terminals)
+        return None
+
     def log_msg(self, msg: str) -> None:
         self._logger.log(msg)
         return None